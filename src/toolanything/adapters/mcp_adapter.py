@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import platform
 from importlib.metadata import PackageNotFoundError, version
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.registry import ToolRegistry
 from ..exceptions import ToolError
+from ..utils.json_tools import to_json_bytes
 
 from .base_adapter import BaseAdapter
 
@@ -17,9 +18,23 @@ class MCPAdapter(BaseAdapter):
     PROTOCOL_VERSION = "2025-11-25"
     SERVER_NAME = "ToolAnything"
 
+    _tools_body_cache: Optional[Tuple[int, bytes]] = None
+
     def to_schema(self) -> List[Dict[str, Any]]:
         return self.registry.to_mcp_tools(adapter="mcp")
 
+    def to_tools_body_bytes(self) -> bytes:
+        """回傳 HTTP ``GET /tools`` 的 JSON body，registry 版本不變時重用快取。"""
+
+        version = self.registry.version
+        cached = self._tools_body_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        body = to_json_bytes({"tools": self.registry.to_mcp_tools()})
+        self._tools_body_cache = (version, body)
+        return body
+
     async def to_invocation(
         self,
         name: str,
@@ -27,8 +42,10 @@ class MCPAdapter(BaseAdapter):
         user_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         normalized_args = arguments or {}
-        audit_log = self.security_manager.audit_call(name, normalized_args, user_id)
         masked_args = self.security_manager.mask_keys_in_log(normalized_args)
+        audit_log = self.security_manager.audit_call(
+            name, normalized_args, user_id, masked_args=masked_args
+        )
 
         try:
             result = await self.registry.invoke_tool_async(
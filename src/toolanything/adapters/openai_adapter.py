@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.registry import ToolRegistry
 from ..exceptions import ToolError
+from ..utils.json_tools import from_json, to_json_bytes
 from ..utils.openai_tool_names import build_openai_name_mappings
 
 from .base_adapter import BaseAdapter
@@ -14,9 +15,19 @@ from .base_adapter import BaseAdapter
 class OpenAIAdapter(BaseAdapter):
     """輸出 OpenAI 工具定義並支援工具呼叫包裝。"""
 
+    # (registry 版本, 名稱對照表)；每次呼叫都要換算名稱，registry 未變動時不必重建。
+    _name_mappings_cache: Optional[Tuple[int, tuple[dict[str, str], dict[str, str]]]] = None
+
     def _build_name_mappings(self) -> tuple[dict[str, str], dict[str, str]]:
+        version = self.registry.version
+        cached = self._name_mappings_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         tool_names = [tool["name"] for tool in self.registry.to_mcp_tools(adapter="openai")]
-        return build_openai_name_mappings(tool_names)
+        mappings = build_openai_name_mappings(tool_names)
+        self._name_mappings_cache = (version, mappings)
+        return mappings
 
     def to_openai_name(self, name: str) -> str:
         original_to_openai, openai_to_original = self._build_name_mappings()
@@ -45,7 +56,7 @@ class OpenAIAdapter(BaseAdapter):
             return arguments
 
         if isinstance(arguments, str):
-            return json.loads(arguments)
+            return from_json(arguments)
 
         raise TypeError("arguments 必須為 dict、JSON 字串或 None")
 
@@ -90,7 +101,7 @@ class OpenAIAdapter(BaseAdapter):
             "type": "function",
             "function": {
                 "name": resolved_name,
-                "arguments": json.dumps(normalized, ensure_ascii=False),
+                "arguments": to_json_bytes(normalized).decode("utf-8"),
             },
         }
         if tool_call_id:
@@ -109,8 +120,10 @@ class OpenAIAdapter(BaseAdapter):
 
         original_name = self.from_openai_name(name)
         normalized_args = self._normalize_arguments(arguments)
-        audit_log = self.security_manager.audit_call(original_name, normalized_args, user_id)
         masked_args = self.security_manager.mask_keys_in_log(normalized_args)
+        audit_log = self.security_manager.audit_call(
+            original_name, normalized_args, user_id, masked_args=masked_args
+        )
 
         try:
             result = await self.registry.invoke_tool_async(
@@ -29,6 +29,7 @@ from .cli_export import (
 from .cli_export.config import cli_project_to_dict
 from .core import FailureLogManager, ToolRegistry, ToolSearchTool
 from .core.connection_tester import ConnectionTester, render_report
+from .utils.json_tools import to_json
 from .utils.logger import logger
 
 
@@ -69,7 +70,7 @@ def _init_claude_config(path: Path, port: int, force: bool, module: str | None)
     if path.exists() and not force:
         raise FileExistsError(f"{path} 已存在，如要覆寫請加入 --force")
 
-    path.write_text(json.dumps(template, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_text(to_json(template), encoding="utf-8")
     print(f"已生成 {path}，將內容加入 Claude Desktop 設定即可完成註冊。")
 
 
@@ -285,7 +286,7 @@ def _install_claude_config(path: Path, port: int, name: str, module: str | None)
     mcp_servers = config.setdefault("mcpServers", {})
     mcp_servers[name] = _build_mcp_entry(port, module, stdio=True)
 
-    path.write_text(json.dumps(config, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_text(to_json(config), encoding="utf-8")
     print(
         f"已更新 {path}，新增 {name} MCP 伺服器設定，重新啟動 Claude Desktop 後即可自動載入。"
     )
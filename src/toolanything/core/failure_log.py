@@ -1,52 +1,214 @@
 """失敗次數紀錄與衰減計算管理器。"""
 from __future__ import annotations
 
-import json
+import os
+import tempfile
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional
+
+from ..utils.json_tools import from_json, to_json_bytes
+
+_DECAY_TABLE_SIZE = 1024
+
+
+class _FailureRecord(NamedTuple):
+    """單一工具的失敗統計；內部以 tuple 保存，只在對外與落地時轉成 dict。"""
+
+    count: int
+    last_failed: float
+    recent: tuple[float, ...]
+    last_seq: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_FailureRecord":
+        return cls(
+            count=int(data.get("count", 0)),
+            last_failed=float(data.get("last_failed", 0.0)),
+            recent=tuple(data.get("recent", ())),
+            last_seq=int(data.get("last_seq", 0)),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "last_failed": self.last_failed,
+            "recent": list(self.recent),
+            "last_seq": self.last_seq,
+        }
+
+
+class _JournalWriter:
+    """journal 的寫入緩衝；flush_interval > 0 時把短時間內的多筆事件合併成一次寫入。
+
+    緩衝在 flush_interval 秒到期或累積 flush_every 筆事件時寫出，以先到者為準。
+    """
+
+    def __init__(self, path: Path, flush_interval: float, flush_every: int) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_every = flush_every
+        self._lines: list[bytes] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def write(self, line: bytes) -> None:
+        with self._lock:
+            self._lines.append(line)
+            if self.flush_interval > 0 and len(self._lines) < self.flush_every:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._lines:
+                return
+            payload = b"".join(self._lines)
+            self._lines.clear()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as journal:
+                journal.write(payload)
+
+    def reset(self) -> None:
+        """快照已涵蓋所有事件：丟棄尚未寫出的緩衝並移除 journal。"""
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._lines.clear()
+            self.path.unlink(missing_ok=True)
 
 
 class FailureLogManager:
     """紀錄工具失敗次數並計算排序用的衰減分數。"""
 
-    def __init__(self, path: str | Path | None = None, *, decay_base: float = 0.9, max_recent: int = 20) -> None:
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        decay_base: float = 0.9,
+        max_recent: int = 20,
+        compact_every: int = 100,
+        flush_interval: float = 0.0,
+        flush_every: int = 32,
+    ) -> None:
         self.path = Path(path) if path else None
+        # 每次失敗只追加一行事件到 journal，累積 compact_every 筆後才重寫完整快照。
+        self.journal_path = self.path.with_name(self.path.name + ".journal") if self.path else None
+        self._journal: _JournalWriter | None = None
+        if self.journal_path:
+            self._journal = _JournalWriter(self.journal_path, flush_interval, flush_every)
+            # 物件被回收或程式結束時寫出尚未落地的事件。
+            weakref.finalize(self, self._journal.flush)
         self.decay_base = decay_base
         self.max_recent = max_recent
-        self._records: Dict[str, Dict[str, Any]] = {}
-
-        if self.path and self.path.exists():
+        self.compact_every = compact_every
+        self._records: Dict[str, _FailureRecord] = {}
+        self._pending = 0
+        self._snapshot_written = False
+        # 以失敗事件序號作為另一條衰減軸：衰減係數預先查表，與牆鐘時間無關、結果可重現。
+        self._seq = 0
+        self._decay_table = [decay_base**step for step in range(_DECAY_TABLE_SIZE)]
+
+        if self.path:
             self._load()
 
     def _load(self) -> None:
-        content = self.path.read_text(encoding="utf-8") if self.path else ""
-        if not content:
+        if self.path and self.path.exists():
+            self._snapshot_written = True
+            content = self.path.read_bytes()
+            if content:
+                self._records = {
+                    name: _FailureRecord.from_dict(record) for name, record in from_json(content).items()
+                }
+                self._seq = max((record.last_seq for record in self._records.values()), default=0)
+
+        if self.journal_path and self.journal_path.exists():
+            truncated = False
+            with self.journal_path.open("rb") as journal:
+                for line in journal:
+                    try:
+                        event = from_json(line)
+                        tool_name, timestamp = event["name"], float(event["ts"])
+                    except (ValueError, KeyError, TypeError):
+                        # 寫到一半中斷或欄位不完整的行直接略過。
+                        truncated = True
+                        continue
+                    self._apply(tool_name, timestamp)
+                    self._pending += 1
+            if truncated:
+                # 立即壓實，避免之後追加的事件接在殘缺行後面而一併遺失。
+                self.compact()
+
+    def _apply(self, tool_name: str, timestamp: float) -> None:
+        self._seq += 1
+        previous = self._records.get(tool_name)
+        if previous is None:
+            count, recent = 1, (timestamp,)
+        else:
+            count, recent = previous.count + 1, (*previous.recent, timestamp)[-self.max_recent :]
+        self._records[tool_name] = _FailureRecord(count, timestamp, recent, self._seq)
+
+    def _append(self, tool_name: str, timestamp: float) -> None:
+        if not self._journal:
             return
-        self._records = json.loads(content)
+        self._journal.write(to_json_bytes({"name": tool_name, "ts": timestamp}) + b"\n")
+        self._pending += 1
+        if self._pending >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """將目前紀錄原子性寫成快照，並清空 journal。"""
 
-    def _save(self) -> None:
         if not self.path:
             return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._records, ensure_ascii=False, indent=2), encoding="utf-8")
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            snapshot = {name: record.to_dict() for name, record in self._records.items()}
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(to_json_bytes(snapshot))
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._snapshot_written = True
+        if self._journal:
+            self._journal.reset()
+        self._pending = 0
+
+    def flush(self) -> None:
+        """立即寫出緩衝中的 journal 事件。"""
+
+        if self._journal:
+            self._journal.flush()
 
     def record_failure(self, tool_name: str, *, timestamp: Optional[float] = None) -> None:
         """記錄一次失敗，並更新相關統計資訊。"""
 
         now = timestamp if timestamp is not None else time.time()
-        record = self._records.setdefault(tool_name, {"count": 0, "last_failed": 0.0, "recent": []})
-        record["count"] += 1
-        record["last_failed"] = now
-        record["recent"].append(now)
-        if len(record["recent"]) > self.max_recent:
-            record["recent"] = record["recent"][-self.max_recent :]
-        self._save()
+        self._apply(tool_name, now)
+        if self.path and not self._snapshot_written:
+            # 第一次失敗同步寫出快照，確保紀錄檔在 record_failure 回傳後即存在。
+            self.compact()
+            return
+        self._append(tool_name, now)
 
     def get_record(self, tool_name: str) -> Dict[str, Any] | None:
         """取得指定工具的統計資料。"""
 
-        return self._records.get(tool_name)
+        record = self._records.get(tool_name)
+        return record.to_dict() if record is not None else None
 
     def failure_score(self, tool_name: str, *, now: Optional[float] = None) -> float:
         """計算排序用的衰減失敗分數，未有紀錄時回傳 0。"""
@@ -56,11 +218,23 @@ class FailureLogManager:
             return 0.0
 
         current = now if now is not None else time.time()
-        decay_factor = self.decay_base ** max(current - record["last_failed"], 0)
-        return float(record["count"]) * decay_factor
+        decay_factor = self.decay_base ** max(current - record.last_failed, 0)
+        return float(record.count) * decay_factor
+
+    def failure_score_by_interaction(self, tool_name: str, *, seq: Optional[int] = None) -> float:
+        """依失敗事件序號計算衰減分數：距上次失敗每多一筆事件衰減一次，未有紀錄時回傳 0。"""
+
+        record = self._records.get(tool_name)
+        if not record:
+            return 0.0
+
+        current = self._seq if seq is None else seq
+        steps = max(current - record.last_seq, 0)
+        return float(record.count) * self._decay_table[min(steps, _DECAY_TABLE_SIZE - 1)]
 
     def reset(self) -> None:
         """清除所有紀錄。"""
 
         self._records.clear()
-        self._save()
+        self._seq = 0
+        self.compact()
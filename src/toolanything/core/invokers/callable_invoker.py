@@ -2,31 +2,91 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import inspect
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Any, Callable, Mapping
 
 from ...pipeline.context import is_context_parameter
 from ..runtime_types import ExecutionContext, InvocationResult, StreamEmitter
 
 
+_UNRESOLVED = object()
+
+_sync_executor: ThreadPoolExecutor | None = None
+_sync_executor_lock = threading.Lock()
+# 標記目前呼叫鏈已在共用 pool 內執行；巢狀的同步呼叫不可再佔用同一個 pool。
+_in_shared_sync_pool: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "toolanything_in_shared_sync_pool", default=False
+)
+
+
+def get_sync_executor() -> ThreadPoolExecutor:
+    """取得同步工具共用的 thread pool。
+
+    execute_tool() 每次都以 asyncio.run 建立新事件迴圈，若沿用迴圈預設 executor，
+    每次呼叫都會重新建立並關閉 worker thread；改用行程內共用且有上限的 pool。
+    """
+
+    global _sync_executor
+    if _sync_executor is None:
+        with _sync_executor_lock:
+            if _sync_executor is None:
+                _sync_executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) + 4),
+                    thread_name_prefix="toolanything-sync",
+                )
+    return _sync_executor
+
+
+def shutdown_sync_executor(*, wait: bool = True) -> None:
+    """關閉共用 thread pool；之後的呼叫會重新建立新的 pool。"""
+
+    global _sync_executor
+    with _sync_executor_lock:
+        executor, _sync_executor = _sync_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
 class CallableInvoker:
     """封裝現有 sync/async function 的執行語意。"""
 
-    def __init__(self, func: Callable[..., Any]) -> None:
+    def __init__(self, func: Callable[..., Any], *, executor: Executor | None = None) -> None:
         self.func = func
+        self.executor = executor
+        self._context_argument: str | None | object = _UNRESOLVED
 
     def _detect_context_argument(self) -> str | None:
-        signature = inspect.signature(self.func)
-        for name, param in signature.parameters.items():
-            if is_context_parameter(param):
-                return name
-        return None
+        # signature 掃描只做一次，避免每次呼叫都建立 Signature/Parameter 物件。
+        if self._context_argument is _UNRESOLVED:
+            detected: str | None = None
+            signature = inspect.signature(self.func)
+            for name, param in signature.parameters.items():
+                if is_context_parameter(param):
+                    detected = name
+                    break
+            self._context_argument = detected
+        return self._context_argument  # type: ignore[return-value]
 
     async def _execute_callable(self, *args: Any, **kwargs: Any) -> Any:
         if inspect.iscoroutinefunction(self.func):
             return await self.func(*args, **kwargs)
 
-        result = await asyncio.to_thread(self.func, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        # 與 asyncio.to_thread 相同，讓同步工具看得到呼叫端的 contextvars。
+        context = contextvars.copy_context()
+        executor = self.executor
+        if executor is None and not _in_shared_sync_pool.get():
+            executor = get_sync_executor()
+            context.run(_in_shared_sync_pool.set, True)
+        # 同步工具內再以 execute_tool 同步呼叫其他工具時，外層 worker 會阻塞等待結果；
+        # 若再排入共用 pool，pool 滿時即死結，故巢狀呼叫改用該次事件迴圈自己的 executor。
+        call = functools.partial(context.run, self.func, *args, **kwargs)
+        result = await loop.run_in_executor(executor, call)
         if inspect.isawaitable(result):
             return await result
         return result
@@ -55,4 +115,4 @@ class CallableInvoker:
         return InvocationResult(output=result)
 
 
-__all__ = ["CallableInvoker"]
+__all__ = ["CallableInvoker", "get_sync_executor", "shutdown_sync_executor"]
@@ -9,7 +9,7 @@ from ..utils.docstring_parser import DocMetadata
 from ..utils.docstring_parser import parse_docstring
 from ..utils.openai_tool_names import build_openai_name_mappings
 from .invokers import CallableInvoker, Invoker
-from .schema import build_parameters_schema, to_openai_strict_schema
+from .schema import FrozenSchema, frozen_parameters_schema, thaw_schema, to_openai_strict_schema
 from .metadata import ToolMetadata, normalize_metadata
 
 
@@ -24,6 +24,13 @@ def _derive_default_name(func: Callable[..., Any]) -> str:
     return getattr(func, "__name__", "")
 
 
+def _export_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    # 對外輸出的 schema 維持一般可修改的 dict，共用的唯讀 schema 只留在內部。
+    if isinstance(schema, FrozenSchema):
+        return thaw_schema(schema)
+    return schema
+
+
 def _merge_cli_metadata(
     metadata: Dict[str, Any] | None,
     cli_command: str | None,
@@ -42,6 +49,9 @@ def _merge_cli_metadata(
 class DefinitionMixin:
     """工具與 Pipeline 的共用基底類別 (Mixin)。"""
 
+    # 空 slots 讓 slots 化的子類別（ToolContract/ToolSpec）不會再帶出 __dict__。
+    __slots__ = ()
+
     # 這些欄位將由子類別 (dataclass) 定義
     # description: str
     # parameters: Dict[str, Any]
@@ -72,6 +82,8 @@ class DefinitionMixin:
         active_parameters = parameters or self.parameters
         if active_strict:
             active_parameters = to_openai_strict_schema(active_parameters)
+        else:
+            active_parameters = _export_schema(active_parameters)
         openai_name = name or build_openai_name_mappings([self.name])[0][self.name]
         return {
             "type": "function",
@@ -87,7 +99,7 @@ class DefinitionMixin:
         payload = {
             "name": self.name,
             "description": self._compose_description(),
-            "inputSchema": self.parameters,
+            "inputSchema": _export_schema(self.parameters),
         }
         metadata = getattr(self, "metadata", {}) or {}
         title = metadata.get("title")
@@ -167,7 +179,7 @@ def _normalize_cli_segment(segment: str) -> str:
     return slug or "tool"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolContract(DefinitionMixin):
     """工具契約：對外 schema 與 metadata 的穩定視圖。"""
 
@@ -183,7 +195,7 @@ class ToolContract(DefinitionMixin):
     invoker_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolSpec(ToolContract):
     """標準化工具描述。
 
@@ -192,11 +204,25 @@ class ToolSpec(ToolContract):
 
     func: Callable[..., Any] | None = field(default=None, repr=False, compare=False)
     invoker: Invoker | None = field(default=None, repr=False, compare=False)
+    # 搜尋用的小寫名稱/描述/標籤，建構時算好一次，避免每次搜尋都重新 lower()。
+    _search_text: str = field(init=False, repr=False, compare=False)
+    # 正規化後的 metadata；搜尋時每個候選都要讀取 cost/latency/category，不必每次重算。
+    _tool_metadata: ToolMetadata = field(init=False, repr=False, compare=False)
+    # tags 的 frozenset，供標籤篩選直接做子集合比較。
+    _tag_set: frozenset[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.invoker is None and self.func is None:
             raise ValueError("ToolSpec 必須至少提供 func 或 invoker。")
 
+        object.__setattr__(
+            self,
+            "_search_text",
+            f"{self.name} {self.description} {' '.join(self.tags)}".lower(),
+        )
+        object.__setattr__(self, "_tool_metadata", normalize_metadata(self.metadata, tags=self.tags))
+        object.__setattr__(self, "_tag_set", frozenset(self.tags))
+
         if self.invoker is None and self.func is not None:
             object.__setattr__(self, "invoker", CallableInvoker(self.func))
 
@@ -242,7 +268,7 @@ class ToolSpec(ToolContract):
         if strict and not derived_description:
             raise ValueError("Tool description is required when strict mode is enabled.")
 
-        params_schema = build_parameters_schema(normalized_func)
+        params_schema = frozen_parameters_schema(normalized_func)
         invoker = CallableInvoker(func)
         return cls(
             name=name or _derive_default_name(normalized_func),
@@ -261,9 +287,9 @@ class ToolSpec(ToolContract):
 
     @property
     def tool_metadata(self) -> ToolMetadata:
-        """回傳正規化後的 metadata 視圖。"""
+        """回傳正規化後的 metadata 視圖（建構時計算一次，metadata 應視為唯讀）。"""
 
-        return normalize_metadata(self.metadata, tags=self.tags)
+        return self._tool_metadata
 
     def normalized_metadata(self) -> ToolMetadata:
         """向下相容的 metadata 視圖方法。"""
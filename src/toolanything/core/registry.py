@@ -1,8 +1,10 @@
 """工具與 pipeline 註冊中心。"""
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from contextlib import contextmanager
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .failure_log import FailureLogManager
 from .invokers import CallableInvoker, Invoker
@@ -32,6 +34,12 @@ class ToolRegistry:
             Tuple[str | None, str], Tuple[str, ToolSpec | PipelineDefinition]
         ] = {}
         self._observers: list[Any] = []
+        self._version = 0
+        # 搜尋用索引：tag -> 工具 key（以 dict 當有序集合保留註冊順序），以及依名稱排序的 (name, key)。
+        self._by_tag: Dict[str, Dict[str, None]] = {}
+        self._names_sorted: List[Tuple[str, str]] = []
+        self._bulk_depth = 0
+        self._pending_invalidation = False
 
         self.tool_prefix = tool_prefix
         self.pipeline_prefix = pipeline_prefix
@@ -48,6 +56,37 @@ class ToolRegistry:
                     cls._global_instance = ToolRegistry()
         return cls._global_instance
 
+    @property
+    def version(self) -> int:
+        """註冊內容的版本號，每次註冊或移除工具/pipeline 都會遞增。"""
+
+        return self._version
+
+    def _invalidate(self, *, deferrable: bool = False) -> None:
+        # 只有新增可以延後：快取只存命中結果，新名稱不會有舊快取；移除則必須立即失效。
+        if deferrable and self._bulk_depth:
+            self._pending_invalidation = True
+            return
+        self._lookup_cache.clear()
+        self._version += 1
+
+    @contextmanager
+    def bulk_register(self) -> Iterator["ToolRegistry"]:
+        """批次註冊期間延後新增造成的快取失效，離開時只清除快取並遞增版本一次。
+
+        區塊內新增的工具可直接查詢，但依 ``version`` 快取的 adapter 結果要等離開後才會更新；
+        移除工具仍會立即失效。
+        """
+
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._pending_invalidation:
+                self._pending_invalidation = False
+                self._invalidate()
+
     # 工具
     def register(self, spec: ToolSpec) -> None:
         kind, normalized_name = self._parse_lookup_name(spec.name)
@@ -61,7 +100,8 @@ class ToolRegistry:
         if spec.invoker is None:
             raise ValueError(f"工具 {spec.name} 缺少 invoker，無法註冊。")
         self._invokers[normalized_name] = spec.invoker
-        self._lookup_cache.clear()
+        self._index_tool(normalized_name, spec)
+        self._invalidate(deferrable=True)
         self._notify_observers("on_tool_registered", spec)
 
     # 舊介面的相容別名
@@ -72,36 +112,90 @@ class ToolRegistry:
         target, normalized_name = self._normalize_lookup_target(name)
         if target not in (None, "tool") or normalized_name not in self._tools:
             raise KeyError(f"找不到工具 {name}")
-        del self._tools[normalized_name]
+        spec = self._tools.pop(normalized_name)
         self._invokers.pop(normalized_name, None)
-        self._lookup_cache.clear()
+        self._unindex_tool(normalized_name, spec)
+        self._invalidate()
         self._notify_observers("on_tool_unregistered", normalized_name)
 
     def get_tool(self, name: str) -> ToolSpec:
         target, normalized_name = self._normalize_lookup_target(name)
-        if target not in (None, "tool") or normalized_name not in self._tools:
+        spec = self._tools.get(normalized_name) if target in (None, "tool") else None
+        if spec is None:
             raise KeyError(f"找不到工具 {name}")
-        return self._tools[normalized_name]
+        return spec
 
     def get_tool_contract(self, name: str) -> ToolSpec:
-        target, normalized_name = self._normalize_lookup_target(name)
-        if target not in (None, "tool") or normalized_name not in self._tools:
-            raise KeyError(f"找不到工具 {name}")
-        return self._tools[normalized_name]
+        return self.get_tool(name)
 
     def get_invoker(self, name: str) -> Invoker:
         target, normalized_name = self._normalize_lookup_target(name)
-        if target not in (None, "tool") or normalized_name not in self._invokers:
+        invoker = self._invokers.get(normalized_name) if target in (None, "tool") else None
+        if invoker is None:
             raise KeyError(f"找不到工具 invoker {name}")
-        return self._invokers[normalized_name]
+        return invoker
 
-    def list(self, *, tags: Optional[List[str]] = None) -> List[ToolSpec]:
-        specs = list(self._tools.values())
-        if not tags:
-            return specs
+    def list(
+        self,
+        *,
+        tags: Optional[List[str]] = None,
+        prefix: str | Sequence[str] | None = None,
+    ) -> List[ToolSpec]:
+        """列出工具；``tags`` 需全部符合，``prefix`` 比對工具名稱開頭（多個時符合任一即可），皆走索引而非全表掃描。"""
+
+        if not tags and not prefix:
+            return list(self._tools.values())
+
+        buckets: list[Dict[str, None]] = []
+        for tag in set(tags or ()):
+            bucket = self._by_tag.get(tag)
+            if not bucket:
+                return []
+            buckets.append(bucket)
+        buckets.sort(key=len)
+
+        if prefix:
+            keys = self._keys_with_prefix(prefix)
+        else:
+            keys = list(buckets.pop(0))
+        return [
+            self._tools[key]
+            for key in keys
+            if all(key in bucket for bucket in buckets)
+        ]
 
-        tag_set = set(tags)
-        return [spec for spec in specs if tag_set.issubset(set(spec.tags))]
+    def _keys_with_prefix(self, prefix: str | Sequence[str]) -> list[str]:
+        if not isinstance(prefix, str):
+            # 多個前綴各自走一段 bisect 範圍，合併去重後維持名稱排序。
+            matched = {entry for item in prefix for entry in self._names_with_prefix(item)}
+            return [key for _, key in sorted(matched)]
+        return [key for _, key in self._names_with_prefix(prefix)]
+
+    def _names_with_prefix(self, prefix: str) -> list[Tuple[str, str]]:
+        names = self._names_sorted
+        index = bisect_left(names, (prefix,))
+        end = index
+        while end < len(names) and names[end][0].startswith(prefix):
+            end += 1
+        return names[index:end]
+
+    def _index_tool(self, key: str, spec: ToolSpec) -> None:
+        for tag in spec.tags:
+            self._by_tag.setdefault(tag, {})[key] = None
+        insort(self._names_sorted, (spec.name, key))
+
+    def _unindex_tool(self, key: str, spec: ToolSpec) -> None:
+        for tag in spec.tags:
+            bucket = self._by_tag.get(tag)
+            if bucket is None:
+                continue
+            bucket.pop(key, None)
+            if not bucket:
+                del self._by_tag[tag]
+        entry = (spec.name, key)
+        index = bisect_left(self._names_sorted, entry)
+        if index < len(self._names_sorted) and self._names_sorted[index] == entry:
+            del self._names_sorted[index]
 
     def add_observer(self, observer: Any) -> None:
         if observer in self._observers:
@@ -125,13 +219,14 @@ class ToolRegistry:
 
         self._assert_not_duplicated(normalized_name, current_kind="pipeline")
         self._pipelines[normalized_name] = definition
-        self._lookup_cache.clear()
+        self._invalidate(deferrable=True)
 
     def get_pipeline(self, name: str) -> PipelineDefinition:
         target, normalized_name = self._normalize_lookup_target(name)
-        if target not in (None, "pipeline") or normalized_name not in self._pipelines:
+        definition = self._pipelines.get(normalized_name) if target in (None, "pipeline") else None
+        if definition is None:
             raise KeyError(f"找不到 pipeline {name}")
-        return self._pipelines[normalized_name]
+        return definition
 
     def list_pipelines(self) -> Dict[str, PipelineDefinition]:
         return dict(self._pipelines)
@@ -140,17 +235,22 @@ class ToolRegistry:
     def _resolve_lookup(self, name: str) -> Tuple[str, ToolSpec | PipelineDefinition]:
         target, normalized_name = self._normalize_lookup_target(name)
         cache_key = (target, normalized_name)
-        if cache_key in self._lookup_cache:
-            return self._lookup_cache[cache_key]
-
-        if target in (None, "tool") and normalized_name in self._tools:
-            lookup = ("tool", self._tools[normalized_name])
-            self._lookup_cache[cache_key] = lookup
-            return lookup
-        if target in (None, "pipeline") and normalized_name in self._pipelines:
-            lookup = ("pipeline", self._pipelines[normalized_name])
-            self._lookup_cache[cache_key] = lookup
-            return lookup
+        cached = self._lookup_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if target in (None, "tool"):
+            spec = self._tools.get(normalized_name)
+            if spec is not None:
+                lookup = ("tool", spec)
+                self._lookup_cache[cache_key] = lookup
+                return lookup
+        if target in (None, "pipeline"):
+            definition = self._pipelines.get(normalized_name)
+            if definition is not None:
+                lookup = ("pipeline", definition)
+                self._lookup_cache[cache_key] = lookup
+                return lookup
 
         raise KeyError(f"找不到 {name}")
 
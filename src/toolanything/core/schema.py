@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import copy
 import inspect
+import weakref
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
@@ -10,6 +11,7 @@ from types import UnionType
 from typing import Any, Dict, get_args, get_origin, get_type_hints
 
 from ..pipeline.context import is_context_parameter
+from ..utils.frozen import FrozenDict, FrozenList
 
 
 @dataclass
@@ -29,6 +31,33 @@ _TYPE_MAPPING = {
 }
 
 
+# 唯讀 schema 與 protocol 的共用錯誤內容使用同一個唯讀 dict 實作。
+FrozenSchema = FrozenDict
+
+
+# 只有 type 的純型別片段在所有凍結 schema 之間共用同一實例。
+_INTERNED_TYPE_SCHEMAS: Dict[str, FrozenSchema] = {
+    json_type: FrozenSchema({"type": json_type})
+    for json_type in ("string", "integer", "number", "boolean", "object", "array", "null")
+}
+
+
+def freeze_schema(node: Any) -> Any:
+    """遞迴將 schema 內的 dict 轉為 FrozenSchema、list 轉為 FrozenList。"""
+
+    if isinstance(node, (FrozenSchema, FrozenList)):
+        return node
+    if isinstance(node, dict):
+        if len(node) == 1 and isinstance(node.get("type"), str):
+            interned = _INTERNED_TYPE_SCHEMAS.get(node["type"])
+            if interned is not None:
+                return interned
+        return FrozenSchema({key: freeze_schema(value) for key, value in node.items()})
+    if isinstance(node, list):
+        return FrozenList(freeze_schema(value) for value in node)
+    return node
+
+
 def _literal_schema(py_type: Any) -> Dict[str, Any]:
     values = list(get_args(py_type))
     return {"enum": values}
@@ -45,25 +74,29 @@ def _enum_schema(py_type: type[Enum]) -> Dict[str, Any]:
 
 
 def _union_schema(args: tuple[Any, ...]) -> Dict[str, Any]:
-    return {"oneOf": [python_type_to_schema(arg) for arg in args]}
+    return {"oneOf": [_python_type_to_schema_cached(arg) for arg in args]}
 
 
 def _container_schema(origin: Any, args: tuple[Any, ...]) -> Dict[str, Any]:
     if origin in (list, tuple):
         item_type = args[0] if args else Any
-        return {"type": "array", "items": python_type_to_schema(item_type)}
+        return {"type": "array", "items": _python_type_to_schema_cached(item_type)}
     if origin in (dict, Dict):
         value_type = args[1] if len(args) > 1 else Any
         return {
             "type": "object",
-            "additionalProperties": python_type_to_schema(value_type),
+            "additionalProperties": _python_type_to_schema_cached(value_type),
         }
     return {"type": "string"}
 
 
 @lru_cache(maxsize=128)
 def _python_type_to_schema_cached(py_type: Any) -> Dict[str, Any]:
-    """快取版本的類型轉換，避免重複計算。"""
+    """快取版本的類型轉換，避免重複計算。
+
+    巢狀型別直接引用其他快取項目的子樹，因此結果必須視為唯讀；
+    對外一律經由 ``python_type_to_schema`` 取得副本。
+    """
     if py_type in _TYPE_MAPPING:
         return dict(_TYPE_MAPPING[py_type])
 
@@ -97,19 +130,70 @@ def _python_type_to_schema_cached(py_type: Any) -> Dict[str, Any]:
 def python_type_to_schema(py_type: Any) -> Dict[str, Any]:
     """將 Python 類型轉換成 JSON Schema 片段並確保回傳可安全修改的副本。"""
 
-    # 深拷貝避免外部修改破壞快取內容
-    return copy.deepcopy(_python_type_to_schema_cached(py_type))
+    # 只複製 dict/list 結構即可避免外部修改破壞快取，省去 deepcopy 的 memo 開銷
+    return _copy_schema(_python_type_to_schema_cached(py_type))
+
+
+# 以函數物件為 key 的弱參照快取；不用 __code__ 作 key，因為 functools.wraps
+# 包裝器與 closure 工廠產生的函數會共用同一個 code object。
+_PARAMETERS_SCHEMA_CACHE: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _copy_schema(node: Any) -> Any:
+    """只複製 dict/list 結構，default 等葉節點值維持原物件。"""
+
+    if isinstance(node, dict):
+        return {key: _copy_schema(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_schema(value) for value in node]
+    return node
+
+
+def thaw_schema(node: Any) -> Any:
+    """將（可能含 FrozenSchema 的）schema 複製成一般可修改的 dict/list，供對外輸出。"""
+
+    return _copy_schema(node)
 
 
 def build_parameters_schema(func: Any) -> Dict[str, Any]:
-    """從函數簽名生成 OpenAI/MCP 相容的 parameters schema。"""
+    """從函數簽名生成 OpenAI/MCP 相容的 parameters schema。
+
+    同一個函數物件的結果會被快取，每次回傳可安全修改的副本。
+    """
+    return _copy_schema(frozen_parameters_schema(func))
+
+
+def frozen_parameters_schema(func: Any) -> Dict[str, Any]:
+    """回傳唯讀的 parameters schema；同一函數物件重複呼叫時直接共用快取，不再複製或凍結。"""
+
+    try:
+        cached = _PARAMETERS_SCHEMA_CACHE.get(func)
+    except TypeError:  # 不可弱參照或不可雜湊的 callable
+        cached = None
+    if cached is not None:
+        return cached
+
+    schema, hints_resolved = _build_parameters_schema(func)
+    frozen = freeze_schema(schema)
+    if hints_resolved:
+        # type hints 解析失敗（例如 forward ref 尚未定義）時不快取，留待之後重試。
+        try:
+            _PARAMETERS_SCHEMA_CACHE[func] = frozen
+        except TypeError:
+            pass
+    return frozen
+
+
+def _build_parameters_schema(func: Any) -> tuple[Dict[str, Any], bool]:
     signature = inspect.signature(func)
     properties: Dict[str, Any] = {}
     required = []
     try:
         resolved_hints = get_type_hints(func)
+        hints_resolved = True
     except Exception:
         resolved_hints = {}
+        hints_resolved = False
 
     for name, param in signature.parameters.items():
         if name in {"self", "cls"}:
@@ -122,7 +206,8 @@ def build_parameters_schema(func: Any) -> Dict[str, Any]:
             name,
             param.annotation if param.annotation is not inspect._empty else str,
         )
-        schema = python_type_to_schema(annotation)
+        # 結果只會經由 _copy_schema 對外回傳，這裡可直接引用快取內容
+        schema = _python_type_to_schema_cached(annotation)
         if param.default is not inspect._empty:
             schema = {**schema, "default": param.default}
             is_required = False
@@ -133,12 +218,15 @@ def build_parameters_schema(func: Any) -> Dict[str, Any]:
         if is_required:
             required.append(name)
 
-    return {
-        "type": "object",
-        "properties": properties,
-        "required": required,
-        "additionalProperties": False,
-    }
+    return (
+        {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+            "additionalProperties": False,
+        },
+        hints_resolved,
+    )
 
 
 def to_openai_strict_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -146,9 +234,14 @@ def to_openai_strict_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
 
     OpenAI strict mode requires every object to declare
     ``additionalProperties: false`` and to list every property as required.
+    The result is always made of plain, mutable dicts.
     """
 
-    normalized = copy.deepcopy(schema)
+    if isinstance(schema, FrozenSchema):
+        # 唯讀 schema 的葉節點不會被改動，只需複製 dict/list 結構，省去 deepcopy 的 memo 開銷。
+        normalized = thaw_schema(schema)
+    else:
+        normalized = copy.deepcopy(schema)
     _normalize_openai_strict_node(normalized)
     return normalized
 
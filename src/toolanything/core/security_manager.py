@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
 
 class SecurityManager:
     MASK = "***MASKED***"
@@ -40,14 +43,11 @@ class SecurityManager:
 
     @classmethod
     def _normalize_key(cls, key: str) -> str:
-        return re.sub(r"[^a-z0-9]+", "", key.lower())
+        return _NON_ALNUM.sub("", key.lower())
 
     @classmethod
     def _is_sensitive_key(cls, key: str) -> bool:
-        normalized = cls._normalize_key(key)
-        if normalized in cls._EXACT_SENSITIVE_KEYS:
-            return True
-        return any(normalized.endswith(suffix) for suffix in cls._SENSITIVE_SUFFIXES)
+        return _is_sensitive_key_cached(cls, key)
 
     def _mask_value(self, value: Any) -> Any:
         if isinstance(value, dict):
@@ -68,10 +68,24 @@ class SecurityManager:
         return masked
 
     def audit_call(
-        self, tool_name: str, args: Dict[str, Any], user: str | None = None
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        user: str | None = None,
+        *,
+        masked_args: Dict[str, Any] | None = None,
     ) -> Dict[str, Any]:
+        """建立稽核紀錄；呼叫端已遮罩過參數時可傳入 ``masked_args`` 避免重複遮罩。"""
         return {
             "tool": tool_name,
             "user": user or "anonymous",
-            "args": self.mask_keys_in_log(args),
+            "args": self.mask_keys_in_log(args) if masked_args is None else masked_args,
         }
+
+
+# 參數 key 的種類很少且重複出現，依 (類別, key) 快取判斷結果，省去每次的 regex 正規化。
+@lru_cache(maxsize=1024)
+def _is_sensitive_key_cached(cls: type[SecurityManager], key: str) -> bool:
+    normalized = cls._normalize_key(key)
+    # str.endswith 接受 tuple，一次在 C 層比對所有後綴。
+    return normalized in cls._EXACT_SENSITIVE_KEYS or normalized.endswith(cls._SENSITIVE_SUFFIXES)
@@ -2,22 +2,35 @@
 from __future__ import annotations
 
 import difflib
+import heapq
 import time
 from dataclasses import dataclass
-from typing import Callable, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional, Sequence, TypeVar
 
-from .metadata import normalize_metadata
 from .models import ToolSpec
 
 
 FailureScoreFunc = Callable[..., float]
 
+_T = TypeVar("_T")
+
+
+def _top_k(items: list[_T], top_k: int) -> list[_T]:
+    """取排序後前 top_k 筆，結果與 ``sorted(items)[:top_k]`` 相同。
+
+    top_k 遠小於候選數時用 heap（O(n log k)）；接近全部時 heap 反而較慢，直接排序。
+    """
+
+    if top_k < 0 or top_k * 2 >= len(items):
+        return sorted(items)[:top_k]
+    return heapq.nsmallest(top_k, items)
+
 
 @dataclass(frozen=True)
 class SelectionOptions:
     query: str = ""
     tags: Optional[list[str]] = None
-    prefix: Optional[str] = None
+    prefix: str | Sequence[str] | None = None
     top_k: int = 10
     sort_by_failure: bool = True
     max_cost: Optional[float] = None
@@ -48,23 +61,28 @@ class RuleBasedStrategy(BaseToolSelectionStrategy):
         if not query:
             return 0.0
 
-        target = f"{spec.name} {spec.description} {' '.join(spec.tags)}"
-        if query.lower() in target.lower():
+        query = query.lower()
+        target = spec._search_text
+        if query in target:
             return 1.0
-        return difflib.SequenceMatcher(None, query.lower(), target.lower()).ratio()
+        return difflib.SequenceMatcher(None, query, target).ratio()
 
     def _filter_by_tags(self, specs: Iterable[ToolSpec], tags: Optional[List[str]]) -> list[ToolSpec]:
         if not tags:
             return list(specs)
 
-        tag_set = set(tags)
-        return [spec for spec in specs if tag_set.issubset(set(spec.tags))]
+        tag_set = frozenset(tags)
+        return [spec for spec in specs if tag_set <= spec._tag_set]
 
-    def _filter_by_prefix(self, specs: Iterable[ToolSpec], prefix: Optional[str]) -> list[ToolSpec]:
+    def _filter_by_prefix(
+        self, specs: Iterable[ToolSpec], prefix: str | Sequence[str] | None
+    ) -> list[ToolSpec]:
         if not prefix:
             return list(specs)
 
-        return [spec for spec in specs if spec.name.startswith(prefix)]
+        # str.startswith 接受 tuple，多個前綴在一次 C 層呼叫內比對完。
+        prefixes = prefix if isinstance(prefix, str) else tuple(prefix)
+        return [spec for spec in specs if spec.name.startswith(prefixes)]
 
     def _filter_by_metadata(
         self,
@@ -78,7 +96,7 @@ class RuleBasedStrategy(BaseToolSelectionStrategy):
         filtered = []
         category_set = set(categories or ())
         for spec in specs:
-            meta = normalize_metadata(spec.metadata, tags=spec.tags)
+            meta = spec.tool_metadata
 
             if max_cost is not None and meta.cost is not None and meta.cost > max_cost:
                 continue
@@ -113,37 +131,23 @@ class RuleBasedStrategy(BaseToolSelectionStrategy):
         )
 
         snapshot_time = now if now is not None else time.time()
-        scored = []
-        for spec in specs:
+        # 先把排序 key 組成 tuple（最後放 index 保證不會比較到 ToolSpec），排序時只剩 C 層的 tuple 比較。
+        keyed: list[tuple[tuple[Any, ...], ToolSpec]] = []
+        for index, spec in enumerate(specs):
             similarity = self._similarity_score(options.query, spec)
-            failure = failure_score(spec.name, now=snapshot_time)
-            metadata = normalize_metadata(spec.metadata, tags=spec.tags)
-            cost_sort = metadata.cost if metadata.cost is not None else float("inf")
-            latency_sort = (
-                metadata.latency_hint_ms if metadata.latency_hint_ms is not None else float("inf")
-            )
-            scored.append((spec, similarity, failure, cost_sort, latency_sort))
-
-        if options.use_metadata_ranking:
-            scored.sort(
-                key=lambda item: (
-                    -item[1],
-                    item[2] if options.sort_by_failure else 0,
-                    item[3],
-                    item[4],
-                    item[0].name,
-                )
-            )
-        else:
-            scored.sort(
-                key=lambda item: (
-                    -item[1],
-                    item[2] if options.sort_by_failure else 0,
-                    item[0].name,
+            failure = failure_score(spec.name, now=snapshot_time) if options.sort_by_failure else 0
+            if options.use_metadata_ranking:
+                metadata = spec.tool_metadata
+                cost_sort = metadata.cost if metadata.cost is not None else float("inf")
+                latency_sort = (
+                    metadata.latency_hint_ms if metadata.latency_hint_ms is not None else float("inf")
                 )
-            )
+                key: tuple[Any, ...] = (-similarity, failure, cost_sort, latency_sort, spec.name, index)
+            else:
+                key = (-similarity, failure, spec.name, index)
+            keyed.append((key, spec))
 
-        return [spec for spec, *_ in scored[: options.top_k]]
+        return [spec for _, spec in _top_k(keyed, options.top_k)]
 
 
 class HybridStrategy(BaseToolSelectionStrategy):
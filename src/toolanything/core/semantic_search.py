@@ -9,9 +9,8 @@ import math
 from pathlib import Path
 from typing import Any, Callable, Iterable, Mapping, Protocol, Sequence
 
-from .metadata import normalize_metadata
 from .models import ToolSpec
-from .selection_strategies import RuleBasedStrategy, SelectionOptions
+from .selection_strategies import RuleBasedStrategy, SelectionOptions, _top_k
 
 
 class OptionalDependencyNotAvailable(RuntimeError):
@@ -76,7 +75,7 @@ class ToolSearchDocumentBuilder:
         self.include_parameters = include_parameters
 
     def build(self, spec: ToolSpec) -> ToolSearchDocument:
-        metadata = normalize_metadata(spec.metadata, tags=spec.tags)
+        metadata = spec.tool_metadata
         payload: list[str] = [f"Tool name: {spec.name}"]
 
         if self.include_description and spec.description:
@@ -447,55 +446,37 @@ class SemanticRetrievalStrategy(RuleBasedStrategy):
                 now=now,
             )
 
-        scored = []
-        for spec in specs:
+        keyed: list[tuple[tuple[Any, ...], ToolSpec]] = []
+        for index, spec in enumerate(specs):
             semantic_score = semantic_scores.get(spec.name, 0.0)
             lexical_score = self._similarity_score(options.query, spec)
             final_score = (
                 semantic_score * self.semantic_weight
                 + lexical_score * self.lexical_weight
             )
-            failure = failure_score(spec.name, now=now)
-            metadata = spec.normalized_metadata()
-            cost_sort = metadata.cost if metadata.cost is not None else float("inf")
-            latency_sort = (
-                metadata.latency_hint_ms
-                if metadata.latency_hint_ms is not None
-                else float("inf")
-            )
-            scored.append(
-                (
-                    spec,
-                    final_score,
-                    semantic_score,
+            failure = failure_score(spec.name, now=now) if options.sort_by_failure else 0
+            if options.use_metadata_ranking:
+                metadata = spec.normalized_metadata()
+                cost_sort = metadata.cost if metadata.cost is not None else float("inf")
+                latency_sort = (
+                    metadata.latency_hint_ms
+                    if metadata.latency_hint_ms is not None
+                    else float("inf")
+                )
+                key: tuple[Any, ...] = (
+                    -final_score,
+                    -semantic_score,
                     failure,
                     cost_sort,
                     latency_sort,
+                    spec.name,
+                    index,
                 )
-            )
-
-        if options.use_metadata_ranking:
-            scored.sort(
-                key=lambda item: (
-                    -item[1],
-                    -item[2],
-                    item[3] if options.sort_by_failure else 0,
-                    item[4],
-                    item[5],
-                    item[0].name,
-                )
-            )
-        else:
-            scored.sort(
-                key=lambda item: (
-                    -item[1],
-                    -item[2],
-                    item[3] if options.sort_by_failure else 0,
-                    item[0].name,
-                )
-            )
+            else:
+                key = (-final_score, -semantic_score, failure, spec.name, index)
+            keyed.append((key, spec))
 
-        return [spec for spec, *_ in scored[: options.top_k]]
+        return [spec for _, spec in _top_k(keyed, options.top_k)]
 
 
 def _cosine_similarity(left: Sequence[float], right: Sequence[float]) -> float:
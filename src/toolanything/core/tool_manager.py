@@ -13,7 +13,7 @@ from .failure_log import FailureLogManager
 from .source_specs import HttpSourceSpec, ModelSourceSpec, SqlSourceSpec
 from .sql_connections import SQLConnectionProvider
 from .sql_tools import register_sql_tool
-from ..runtime.concurrency import ParallelOptions, RetryPolicy, parallel_map_async
+from ..runtime.concurrency import ParallelOptions, RetryPolicy, parallel_map_workers
 
 
 class ToolManager:
@@ -147,6 +147,8 @@ class ToolManager:
         v1 strategy:
         - keep behavior consistent with invoke()
         - concurrency / retry / rate limit as execution options
+        - a fixed pool of `concurrency` workers, so large batches do not
+          create one task per item
         """
 
         policy = RetryPolicy(max_retries=max_retries)
@@ -160,4 +162,4 @@ class ToolManager:
         async def _one(args: Dict[str, Any]) -> Any:
             return await self.invoke(name, args, context=context)
 
-        return await parallel_map_async(list(args_list), _one, options=options)
+        return await parallel_map_workers(list(args_list), _one, options=options)
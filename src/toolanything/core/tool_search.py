@@ -1,7 +1,7 @@
 """提供工具搜尋與排序功能。"""
 from __future__ import annotations
 
-from typing import Optional
+from typing import Literal, Optional, Sequence
 
 from .failure_log import FailureLogManager
 from .models import ToolSpec
@@ -21,16 +21,26 @@ class ToolSearchTool:
         registry: ToolRegistry,
         failure_log: FailureLogManager,
         strategy: BaseToolSelectionStrategy | None = None,
+        *,
+        decay_axis: Literal["time", "interaction"] = "time",
     ) -> None:
+        if decay_axis not in ("time", "interaction"):
+            raise ValueError("decay_axis 必須為 'time' 或 'interaction'")
         self.registry = registry
         self.failure_log = failure_log
         self.strategy = strategy or RuleBasedStrategy()
+        self.decay_axis = decay_axis
+
+    def _failure_score(self, tool_name: str, *, now: Optional[float] = None) -> float:
+        if self.decay_axis == "interaction":
+            return self.failure_log.failure_score_by_interaction(tool_name)
+        return self.failure_log.failure_score(tool_name, now=now)
 
     def search(
         self,
         query: str = "",
         tags: Optional[list[str]] = None,
-        prefix: Optional[str] = None,
+        prefix: str | Sequence[str] | None = None,
         top_k: int = 10,
         sort_by_failure: bool = True,
         max_cost: Optional[float] = None,
@@ -41,7 +51,8 @@ class ToolSearchTool:
         *,
         now: Optional[float] = None,
     ) -> list[ToolSpec]:
-        specs = self.registry.list()
+        # 先用 registry 的 tag/prefix 索引縮小候選範圍，策略仍會再套用同樣的篩選。
+        specs = self.registry.list(tags=tags, prefix=prefix)
         auto_metadata_ranking = use_metadata_ranking
         if auto_metadata_ranking is None:
             auto_metadata_ranking = any(
@@ -69,7 +80,7 @@ class ToolSearchTool:
         return self.strategy.select(
             specs,
             options=options,
-            failure_score=self.failure_log.failure_score,
+            failure_score=self._failure_score,
             now=now,
         )
 
@@ -19,9 +19,10 @@ External injection responsibilities (from server/transport):
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Literal, Mapping, Optional, Protocol, Sequence, TypedDict
+from typing import Any, Callable, Dict, Iterable, Literal, Mapping, Optional, Protocol, Sequence, TypedDict
 
 from ..exceptions import ToolError
+from ..utils.frozen import FrozenDict
 
 
 MCP_JSONRPC_VERSION = "2.0"
@@ -103,7 +104,7 @@ class MCPErrorPayload(TypedDict, total=False):
     data: Dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MCPRequestContext:
     """Injected, transport-provided context.
 
@@ -216,10 +217,36 @@ class MCPJSONRPCProtocolCore(MCPProtocolCore):
 
     _JSONRPC_VERSION = MCP_JSONRPC_VERSION
 
+    _ERROR_INVALID_REQUEST = -32600
     _ERROR_METHOD_NOT_FOUND = -32601
     _ERROR_INTERNAL = -32603
     _ERROR_TOOL = -32001
 
+    # 不帶 data 的錯誤內容固定不變，預先建好後直接放進回應，錯誤路徑只需配置外層 envelope。
+    _SHARED_ERROR_BODIES: Dict[tuple[int, str], Dict[str, Any]] = {
+        (code, message): FrozenDict(code=code, message=message)
+        for code, message in (
+            (_ERROR_INVALID_REQUEST, "invalid_request"),
+            (_ERROR_METHOD_NOT_FOUND, "method_not_found"),
+        )
+    }
+
+    # 單一 batch 可容納的請求數上限，避免一次 body 佔用過多記憶體與執行時間。
+    max_batch_size = 100
+
+    # method name -> handler 方法名稱；handle() 以單次 dict 查找取代 if/elif 分派。
+    _DISPATCH_METHODS: Dict[str, str] = {
+        MCP_METHOD_INITIALIZE: "_handle_initialize",
+        MCP_METHOD_NOTIFICATIONS_INITIALIZED: "_handle_initialized_notification",
+        MCP_METHOD_TOOLS_LIST: "_handle_tools_list",
+        MCP_METHOD_TOOLS_CALL: "_handle_tool_call",
+    }
+
+    def __init__(self) -> None:
+        # 每個實例各自綁定 handler，子類別覆寫的 _handle_* 方法才會生效。
+        self._dispatch: Dict[str, Callable[..., Optional[MCPResponse]]] = {
+            method: getattr(self, name) for method, name in self._DISPATCH_METHODS.items()
+        }
 
     def handle(
         self,
@@ -229,21 +256,64 @@ class MCPJSONRPCProtocolCore(MCPProtocolCore):
         deps: MCPProtocolDependencies,
     ) -> Optional[MCPResponse]:
         method = request.get("method")
-        request_id = request.get("id")
+        # method 可能是 list 等不可雜湊的值，先確認型別再查表。
+        handler = self._dispatch.get(method) if isinstance(method, str) else None
+        if handler is None:
+            return self._handle_method_not_found(request.get("id"))
+        return handler(request, context=context, deps=deps)
+
+    def handle_batch(
+        self,
+        requests: Sequence[Any],
+        *,
+        context: MCPRequestContext,
+        deps: MCPProtocolDependencies,
+    ) -> Optional[MCPResponse | list[MCPResponse]]:
+        """依 JSON-RPC 2.0 batch 語意依序處理多個請求。
 
-        if method == MCP_METHOD_INITIALIZE:
-            return self._build_result(request_id, deps.capabilities.get_capabilities())
+        notification 不產生回應；全部都是 notification 時回傳 None。
+        空陣列或超過 ``max_batch_size`` 時回傳單一 invalid_request 錯誤物件（非陣列）。
+        """
 
-        if method == MCP_METHOD_NOTIFICATIONS_INITIALIZED:
-            return None
+        if not requests or len(requests) > self.max_batch_size:
+            return self._build_error(None, self._ERROR_INVALID_REQUEST, "invalid_request")
 
-        if method == MCP_METHOD_TOOLS_LIST:
-            return self._build_result(request_id, {"tools": list(deps.tools.list_tools())})
+        responses: list[MCPResponse] = []
+        for request in requests:
+            if not isinstance(request, dict):
+                responses.append(self._build_error(None, self._ERROR_INVALID_REQUEST, "invalid_request"))
+                continue
+            response = self.handle(request, context=context, deps=deps)
+            if response is not None:
+                responses.append(response)
+        return responses or None
+
+    def _handle_initialize(
+        self,
+        request: MCPRequest,
+        *,
+        context: MCPRequestContext,
+        deps: MCPProtocolDependencies,
+    ) -> Optional[MCPResponse]:
+        return self._build_result(request.get("id"), deps.capabilities.get_capabilities())
 
-        if method == MCP_METHOD_TOOLS_CALL:
-            return self._handle_tool_call(request, context=context, deps=deps)
+    def _handle_initialized_notification(
+        self,
+        request: MCPRequest,
+        *,
+        context: MCPRequestContext,
+        deps: MCPProtocolDependencies,
+    ) -> Optional[MCPResponse]:
+        return None
 
-        return self._handle_method_not_found(request_id)
+    def _handle_tools_list(
+        self,
+        request: MCPRequest,
+        *,
+        context: MCPRequestContext,
+        deps: MCPProtocolDependencies,
+    ) -> Optional[MCPResponse]:
+        return self._build_result(request.get("id"), {"tools": list(deps.tools.list_tools())})
 
     def _handle_tool_call(
         self,
@@ -314,7 +384,6 @@ class MCPJSONRPCProtocolCore(MCPProtocolCore):
 
         return self._build_error(request_id, self._ERROR_METHOD_NOT_FOUND, "method_not_found")
 
-
     def _build_result(
         self,
         request_id: str | int | None,
@@ -339,14 +408,17 @@ class MCPJSONRPCProtocolCore(MCPProtocolCore):
         *,
         data: Optional[Dict[str, Any]] = None,
     ) -> MCPResponse:
-        payload: MCPResponse = {
+        if data is None:
+            error = self._SHARED_ERROR_BODIES.get((code, message))
+            if error is None:
+                error = {"code": code, "message": message}
+        else:
+            error = {"code": code, "message": message, "data": data}
+        return {
             "jsonrpc": self._JSONRPC_VERSION,
             "id": request_id,
-            "error": {"code": code, "message": message},
+            "error": error,
         }
-        if data is not None:
-            payload["error"]["data"] = data
-        return payload
 
 
     def _mask_arguments(
@@ -5,6 +5,7 @@ from .concurrency import (
     call_maybe_async,
     is_async_callable,
     parallel_map_async,
+    parallel_map_workers,
     parallel_run,
     retry_async,
 )
@@ -17,6 +18,7 @@ __all__ = [
     "call_maybe_async",
     "is_async_callable",
     "parallel_map_async",
+    "parallel_map_workers",
     "parallel_run",
     "retry_async",
     "run",
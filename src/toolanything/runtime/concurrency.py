@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import random
 import time
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Type, TypeVar
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -57,8 +58,7 @@ class SimpleRateLimiter:
 
     def __init__(self, rate_limit_per_minute: Optional[int] = None):
         self._rate = rate_limit_per_minute
-        self._lock = asyncio.Lock()
-        self._last_ts = 0.0
+        self._next_ts = 0.0
 
     @property
     def enabled(self) -> bool:
@@ -69,13 +69,13 @@ class SimpleRateLimiter:
             return
 
         interval = 60.0 / float(self._rate)
-        async with self._lock:
-            now = time.monotonic()
-            wait = (self._last_ts + interval) - now
-            if wait > 0:
-                await asyncio.sleep(wait)
-                now = time.monotonic()
-            self._last_ts = now
+        # 預約時段與推進 _next_ts 之間沒有 await，在單一事件迴圈內即為原子操作；
+        # 各呼叫者只睡到自己的 deadline，不必持鎖排隊等待。
+        deadline = max(time.monotonic(), self._next_ts)
+        self._next_ts = deadline + interval
+        wait = deadline - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
 
 
 # ---------------------------
@@ -104,27 +104,37 @@ async def _run_one(
     return await retry_async(_wrapped, policy=policy)
 
 
+async def _collect(coros: Sequence[Awaitable[R]], *, preserve_order: bool) -> List[R]:
+    # gather 本身即保留輸入順序；不需保序時依完成先後收集。
+    if preserve_order:
+        return list(await asyncio.gather(*coros))
+    return [await fut for fut in asyncio.as_completed(coros)]
+
+
 async def parallel_run(
-    coro_factories: Sequence[Callable[[], Awaitable[R]]],
+    coro_factories: Sequence[Union[Callable[[], Awaitable[R]], Awaitable[R]]],
     *,
     options: ParallelOptions = ParallelOptions(),
 ) -> List[R]:
+    """並行執行多個工作，項目可為 coroutine factory 或已建立的 awaitable。
+
+    awaitable 只能 await 一次，因此僅執行一次、不套用 retry_policy；
+    需要重試時請傳入 factory（例如 ``lambda: fetch()``）。
+    """
     limiter = SimpleRateLimiter(options.rate_limit_per_minute)
     sem = asyncio.Semaphore(max(1, options.concurrency))
 
-    async def _guarded(factory: Callable[[], Awaitable[R]]) -> R:
+    async def _guarded(item: Union[Callable[[], Awaitable[R]], Awaitable[R]]) -> R:
         async with sem:
-            return await _run_one(factory, limiter=limiter, policy=options.retry_policy)
-
-    if options.preserve_order:
-        tasks = [asyncio.create_task(_guarded(f)) for f in coro_factories]
-        return await asyncio.gather(*tasks)
+            if inspect.isawaitable(item):
+                await limiter.acquire()
+                return await item
+            return await _run_one(item, limiter=limiter, policy=options.retry_policy)
 
-    results: List[R] = []
-    tasks = [asyncio.create_task(_guarded(f)) for f in coro_factories]
-    for fut in asyncio.as_completed(tasks):
-        results.append(await fut)
-    return results
+    return await _collect(
+        [_guarded(f) for f in coro_factories],
+        preserve_order=options.preserve_order,
+    )
 
 
 async def parallel_map_async(
@@ -133,8 +143,49 @@ async def parallel_map_async(
     *,
     options: ParallelOptions = ParallelOptions(),
 ) -> List[R]:
-    factories = [lambda x=x: fn(x) for x in items]
-    return await parallel_run(factories, options=options)
+    limiter = SimpleRateLimiter(options.rate_limit_per_minute)
+    sem = asyncio.Semaphore(max(1, options.concurrency))
+    policy = options.retry_policy
+
+    async def _bounded(item: T) -> R:
+        async with sem:
+            return await _run_one(lambda: fn(item), limiter=limiter, policy=policy)
+
+    return await _collect(
+        [_bounded(x) for x in items],
+        preserve_order=options.preserve_order,
+    )
+
+
+async def parallel_map_workers(
+    items: Sequence[T],
+    fn: Callable[[T], Awaitable[R]],
+    *,
+    options: ParallelOptions = ParallelOptions(),
+) -> List[R]:
+    """以固定數量的 worker 消化 items，Task 數量只隨 concurrency 成長。
+
+    語意與 parallel_map_async 相同，適合 items 很多、fn 很輕的批次呼叫。
+    """
+
+    limiter = SimpleRateLimiter(options.rate_limit_per_minute)
+    policy = options.retry_policy
+    pending = iter(enumerate(items))
+    ordered: List[Any] = [None] * len(items)
+    completed: List[R] = []
+
+    async def _worker() -> None:
+        # 共用同一個 iterator；next() 之間沒有 await，不會重複取到同一筆。
+        for index, item in pending:
+            result = await _run_one(lambda: fn(item), limiter=limiter, policy=policy)
+            if options.preserve_order:
+                ordered[index] = result
+            else:
+                completed.append(result)
+
+    workers = min(max(1, options.concurrency), len(items))
+    await asyncio.gather(*(_worker() for _ in range(workers)))
+    return ordered if options.preserve_order else completed
 
 
 def is_async_callable(func: Callable[..., Any]) -> bool:
@@ -39,8 +39,17 @@ class ToolInvoker:
         self._serializer = serializer
         self._security_manager = security_manager
 
-    def _audit(self, name: str, arguments: Dict[str, Any], user_id: str) -> Dict[str, Any]:
-        return self._security_manager.audit_call(name or "", arguments, user_id)
+    def _audit(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        user_id: str,
+        *,
+        masked_args: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
+        return self._security_manager.audit_call(
+            name or "", arguments, user_id, masked_args=masked_args
+        )
 
     def _mask(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         return self._security_manager.mask_keys_in_log(arguments)
@@ -54,7 +63,7 @@ class ToolInvoker:
     ) -> Dict[str, Any]:
         user_id = context.user_id or "default"
         masked_args = self._mask(arguments)
-        audit_log = self._audit(name or "", arguments, user_id)
+        audit_log = self._audit(name or "", arguments, user_id, masked_args=masked_args)
 
         result = self._registry.execute_tool(
             name,
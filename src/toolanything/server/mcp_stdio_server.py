@@ -13,6 +13,7 @@ from ..core.registry import ToolRegistry
 from ..core.result_serializer import ResultSerializer
 from ..core.security_manager import SecurityManager
 from ..protocol.mcp_jsonrpc import MCPProtocolCoreImpl, MCPRequestContext
+from ..utils.json_tools import from_json, to_json_bytes
 from .mcp_runtime import build_protocol_dependencies
 
 
@@ -31,23 +32,37 @@ class MCPStdioServer:
         self._protocol_core = MCPProtocolCoreImpl()
         self._default_user_id = os.getenv("TOOLANYTHING_USER_ID", "default")
 
-    def _read_message(self) -> Dict[str, Any] | None:
-        """從 stdin 讀取一行 JSON 訊息並轉為字典。"""
+    def _read_message(self) -> Dict[str, Any] | list[Any] | None:
+        """從 stdin 讀取一行 JSON 訊息並轉為字典。
+
+        有底層 binary buffer 時直接讀 bytes 交給 JSON 解析，省去逐行的文字解碼。
+        """
 
         try:
-            line = sys.stdin.readline()
+            stdin = sys.stdin
+            buffer = getattr(stdin, "buffer", None)
+            line = buffer.readline() if buffer is not None else stdin.readline()
             if not line:
                 return None
-            return json.loads(line)
+            return from_json(line)
         except json.JSONDecodeError:
             return None
         except Exception:
             return None
 
-    def _send_message(self, message: Dict[str, Any]) -> None:
-        """將字典轉為 JSON 字串後寫入 stdout。"""
-        sys.stdout.write(json.dumps(message, ensure_ascii=False) + "\n")
-        sys.stdout.flush()
+    def _send_message(self, message: Dict[str, Any] | list[Dict[str, Any]]) -> None:
+        """將字典轉為 JSON 後寫入 stdout，可用時直接寫入 binary buffer。"""
+        payload = to_json_bytes(message)
+        stdout = sys.stdout
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is None:
+            stdout.write(payload.decode("utf-8") + "\n")
+            stdout.flush()
+            return
+        # 先送出文字層尚未寫出的內容，避免與直接寫入 buffer 的訊息順序錯亂。
+        stdout.flush()
+        buffer.write(payload + b"\n")
+        buffer.flush()
 
     def run(self) -> None:
         """啟動 Stdio Server 迴圈。"""
@@ -57,7 +72,10 @@ class MCPStdioServer:
                 break
 
             context = MCPRequestContext(user_id=self._default_user_id, transport="stdio")
-            response = self._protocol_core.handle(request, context=context, deps=self._deps)
+            if isinstance(request, list):
+                response = self._protocol_core.handle_batch(request, context=context, deps=self._deps)
+            else:
+                response = self._protocol_core.handle(request, context=context, deps=self._deps)
             if response is not None:
                 self._send_message(response)
 
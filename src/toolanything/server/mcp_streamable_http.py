@@ -19,6 +19,7 @@ from ..core.registry import ToolRegistry
 from ..core.result_serializer import ResultSerializer
 from ..core.security_manager import SecurityManager
 from ..protocol.mcp_jsonrpc import MCPProtocolCoreImpl, MCPRequestContext
+from ..utils.json_tools import to_json_bytes
 from .mcp_auth import BearerTokenVerifier
 from .mcp_runtime import build_protocol_dependencies
 
@@ -161,7 +162,25 @@ def _json_response(
     protocol_version: str | None = None,
     session_id: str | None = None,
 ) -> None:
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    _json_body_response(
+        handler,
+        status_code,
+        to_json_bytes(payload),
+        allowed_origins=allowed_origins,
+        protocol_version=protocol_version,
+        session_id=session_id,
+    )
+
+
+def _json_body_response(
+    handler: BaseHTTPRequestHandler,
+    status_code: int,
+    body: bytes,
+    *,
+    allowed_origins: set[str],
+    protocol_version: str | None = None,
+    session_id: str | None = None,
+) -> None:
     handler.send_response(status_code)
     _send_cors_headers(handler, allowed_origins=allowed_origins)
     handler.send_header("Content-Type", "application/json; charset=utf-8")
@@ -532,10 +551,10 @@ def _build_handler(
                 return
 
             if self.path == "/tools":
-                _json_response(
+                _json_body_response(
                     self,
                     200,
-                    {"tools": registry.to_mcp_tools()},
+                    adapter.to_tools_body_bytes(),
                     allowed_origins=allowed_origins,
                     protocol_version=protocol_version,
                 )
@@ -23,6 +23,7 @@ from ..protocol.mcp_jsonrpc import (
 )
 from .mcp_streamable_http import _build_handler as _build_streamable_handler
 from .mcp_runtime import build_protocol_dependencies
+from ..utils.json_tools import to_json_bytes
 from ..utils.logger import configure_logging, logger
 
 _CLIENT_DISCONNECT_ERRORS = (
@@ -110,7 +111,18 @@ def _json_response(
 ) -> None:
     """將 payload 序列化成 JSON 並寫入 HTTP 回應。"""
 
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    _json_body_response(handler, status_code, to_json_bytes(payload), allowed_origins=allowed_origins)
+
+
+def _json_body_response(
+    handler: BaseHTTPRequestHandler,
+    status_code: int,
+    body: bytes,
+    *,
+    allowed_origins: set[str],
+) -> None:
+    """寫入已序列化好的 JSON body。"""
+
     handler.send_response(status_code)
     _send_cors_headers(handler, allowed_origins=allowed_origins)
     handler.send_header("Content-Type", "application/json; charset=utf-8")
@@ -331,10 +343,10 @@ def _build_legacy_handler(
                 return
 
             if parsed.path == "/tools":
-                _json_response(
+                _json_body_response(
                     self,
                     200,
-                    {"tools": registry.to_mcp_tools()},
+                    mcp_adapter.to_tools_body_bytes(),
                     allowed_origins=allowed_origins,
                 )
                 return
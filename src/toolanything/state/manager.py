@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 
 class StateManager:
@@ -133,17 +133,20 @@ class FileBackend(BasePersistentBackend):
 class PersistentStateManager(StateManager):
     """支援多種後端且提供異步操作的狀態管理器。"""
 
+    # backend 名稱 -> 建構函式；只有 file 後端會使用 backend_kwargs。
+    _BACKEND_FACTORIES: Dict[str, Callable[..., BasePersistentBackend]] = {
+        "redis": lambda **_: RedisBackend(),
+        "db": lambda **_: DatabaseBackend(),
+        "database": lambda **_: DatabaseBackend(),
+        "file": FileBackend,
+    }
+
     def __init__(self, backend: str = "redis", **backend_kwargs: Any) -> None:
         super().__init__()
-        normalized = backend.lower()
-        if normalized == "redis":
-            self._backend: BasePersistentBackend = RedisBackend()
-        elif normalized in {"db", "database"}:
-            self._backend = DatabaseBackend()
-        elif normalized == "file":
-            self._backend = FileBackend(**backend_kwargs)
-        else:
+        factory = self._BACKEND_FACTORIES.get(backend.lower())
+        if factory is None:
             raise ValueError(f"Unsupported backend: {backend}")
+        self._backend: BasePersistentBackend = factory(**backend_kwargs)
 
     async def get(self, user_id: str) -> Dict[str, Any]:
         return await self._backend.get(user_id)
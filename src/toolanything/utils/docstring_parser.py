@@ -9,7 +9,8 @@ Tool Calling 與 MCP 描述欄位使用。
 from __future__ import annotations
 
 import inspect
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Callable, Dict, Optional
 
 
@@ -45,14 +46,16 @@ _SECTION_HEADERS = {
     "returns": {"returns", "return", "輸出", "回傳"},
 }
 
+# 攤平成 alias -> section，判斷標頭只需一次 dict 查找。
+_HEADER_TO_SECTION = {
+    alias: section for section, aliases in _SECTION_HEADERS.items() for alias in aliases
+}
+
 
 def _match_section(line: str) -> str | None:
     stripped = line.strip()
     header = stripped.split(":", 1)[0].rstrip(":").lower()
-    for section, aliases in _SECTION_HEADERS.items():
-        if header in aliases:
-            return section
-    return None
+    return _HEADER_TO_SECTION.get(header)
 
 
 def parse_docstring(func: Callable[..., object]) -> DocMetadata | None:
@@ -62,6 +65,13 @@ def parse_docstring(func: Callable[..., object]) -> DocMetadata | None:
     if not raw_doc:
         return None
 
+    cached = _parse_raw_docstring(raw_doc)
+    # 快取實例共用，回傳帶獨立 parameters dict 的副本避免外部修改污染快取。
+    return replace(cached, parameters=dict(cached.parameters))
+
+
+@lru_cache(maxsize=256)
+def _parse_raw_docstring(raw_doc: str) -> DocMetadata:
     summary_lines: list[str] = []
     usage_lines: list[str] = []
     return_lines: list[str] = []
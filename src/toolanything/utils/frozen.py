@@ -0,0 +1,54 @@
+"""唯讀 dict/list，供需要在多處共用同一份 JSON 結構時使用。"""
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List
+
+
+class FrozenDict(dict):
+    """唯讀的 dict。
+
+    仍是 ``dict`` 子類別，JSON 序列化與 ``isinstance(..., dict)`` 判斷都不受影響；
+    ``copy.copy``/``copy.deepcopy`` 會回傳可修改的一般 dict。
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{type(self).__name__} 為唯讀，請先以 copy.deepcopy() 取得可修改的副本。")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> Any:
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    """唯讀的 list，與 FrozenDict 搭配凍結 schema 內的 required/enum 等陣列。
+
+    仍是 ``list`` 子類別；``copy.copy``/``copy.deepcopy`` 會回傳可修改的一般 list。
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{type(self).__name__} 為唯讀，請先以 copy.deepcopy() 取得可修改的副本。")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> Any:
+        return (type(self), (list(self),))
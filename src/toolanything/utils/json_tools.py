@@ -1,12 +1,84 @@
+"""JSON 序列化工具；安裝 orjson 時優先使用，輸出與標準庫 json 保持一致。
+
+與標準庫的差異僅剩 orjson 原生支援、json 會拋 TypeError 的型別：
+``uuid.UUID`` 與非 str/int 子類別的 ``Enum`` 會被序列化成字串或其值。
+"""
 from __future__ import annotations
 
 import json
+import math
 from typing import Any
 
+try:  # orjson 為選用依賴；未安裝時退回標準庫 json。
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - 依環境而定
+    orjson = None  # type: ignore[assignment]
+
+
+def _reject(value: Any) -> Any:
+    # datetime/dataclass 經 passthrough 交到這裡，拋出 TypeError 後改由 json 處理（並照舊報錯）。
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _has_non_finite(node: Any) -> bool:
+    """檢查資料中是否含 NaN/Infinity；orjson 會把它們輸出成 null，json 則輸出 NaN/Infinity。"""
+
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, float):
+            if not math.isfinite(current):
+                return True
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+    return False
+
+
+def _orjson_dumps(data: Any, option: int) -> bytes | None:
+    """以 orjson 序列化；結果可能與 json 不同或 orjson 不支援時回傳 None。"""
+
+    try:
+        body = orjson.dumps(data, default=_reject, option=option)
+    except TypeError:
+        # orjson 不支援的型別（如超過 64 位元的整數）交回 json 處理，維持原有行為。
+        return None
+    # 只有輸出含 null 時才可能是 NaN/Infinity 被改寫，此時才逐一檢查。
+    if b"null" in body and _has_non_finite(data):
+        return None
+    return body
+
 
 def to_json(data: Any) -> str:
+    if orjson is not None:
+        body = _orjson_dumps(data, _ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+        if body is not None:
+            return body.decode("utf-8")
     return json.dumps(data, ensure_ascii=False, indent=2)
 
 
-def from_json(raw: str) -> Any:
+def to_json_bytes(data: Any) -> bytes:
+    """序列化成精簡的 UTF-8 JSON bytes，供 HTTP 回應等熱路徑使用。"""
+
+    if orjson is not None:
+        body = _orjson_dumps(data, _ORJSON_OPTIONS)
+        if body is not None:
+            return body
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def from_json(raw: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # 超過 64 位元的整數等 orjson 不支援的內容交回 json；真正的格式錯誤會在此重新拋出。
+            pass
     return json.loads(raw)
@@ -0,0 +1,20 @@
+"""測試用的 NDJSON 逐行解析工具。"""
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator
+
+
+def iter_ndjson(buf: str) -> Iterator[Any]:
+    """依換行位置逐筆解析 NDJSON，跳過空白行，不先複製整份 buffer。"""
+
+    start = 0
+    size = len(buf)
+    while start < size:
+        end = buf.find("\n", start)
+        if end == -1:
+            end = size
+        line = buf[start:end]
+        if line.strip():
+            yield json.loads(line)
+        start = end + 1
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
 from typing import Any, Dict, Sequence
 
+import pytest
+
 from toolanything.exceptions import ToolError
 from toolanything.protocol.mcp_jsonrpc import (
     MCPJSONRPCProtocolCore,
@@ -261,3 +264,81 @@ def test_golden_tools_call_response() -> None:
         "raw_result": {"status": "ok"},
     }
 
+
+
+def test_handle_batch_returns_responses_in_order_and_skips_notifications() -> None:
+    core = MCPJSONRPCProtocolCore()
+    tools = [{"name": "alpha", "description": "Alpha", "inputSchema": {"type": "object"}}]
+    deps = _make_deps(tools=tools)
+    batch = [
+        build_request("tools/list", 1),
+        build_notification("notifications/initialized", {}),
+        "not-a-request",
+        build_request("unknown/method", 2),
+    ]
+
+    responses = core.handle_batch(batch, context=MCPRequestContext(), deps=deps)
+
+    assert responses == [
+        {"jsonrpc": "2.0", "id": 1, "result": {"tools": tools}},
+        {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "invalid_request"}},
+        {"jsonrpc": "2.0", "id": 2, "error": {"code": -32601, "message": "method_not_found"}},
+    ]
+
+
+def test_handle_batch_rejects_empty_and_oversized_batches() -> None:
+    core = MCPJSONRPCProtocolCore()
+    core.max_batch_size = 2
+    deps = _make_deps()
+    invalid = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "invalid_request"}}
+
+    assert core.handle_batch([], context=MCPRequestContext(), deps=deps) == invalid
+    oversized = [build_request("tools/list", i) for i in range(3)]
+    assert core.handle_batch(oversized, context=MCPRequestContext(), deps=deps) == invalid
+    only_notifications = [build_notification("notifications/initialized", {})]
+    assert core.handle_batch(only_notifications, context=MCPRequestContext(), deps=deps) is None
+
+
+def test_method_not_found_reuses_read_only_error_body() -> None:
+    core = MCPJSONRPCProtocolCore()
+    deps = _make_deps()
+
+    first = core.handle(build_request("unknown/a", 1), context=MCPRequestContext(), deps=deps)
+    second = core.handle(build_request("unknown/b", 2), context=MCPRequestContext(), deps=deps)
+
+    assert first["error"] is second["error"]
+    assert json.loads(json.dumps(first)) == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "error": {"code": -32601, "message": "method_not_found"},
+    }
+    with pytest.raises(TypeError):
+        first["error"]["data"] = {"leak": True}
+    assert second["error"] == {"code": -32601, "message": "method_not_found"}
+
+
+def test_handle_returns_method_not_found_for_unhashable_method() -> None:
+    core = MCPJSONRPCProtocolCore()
+    request = {"jsonrpc": "2.0", "id": 7, "method": ["tools/list"]}
+
+    response = core.handle(request, context=MCPRequestContext(), deps=_make_deps())
+
+    assert response == {
+        "jsonrpc": "2.0",
+        "id": 7,
+        "error": {"code": -32601, "message": "method_not_found"},
+    }
+
+
+def test_handle_dispatches_to_subclass_overrides() -> None:
+    class CustomCore(MCPJSONRPCProtocolCore):
+        def _handle_tools_list(self, request, *, context, deps):
+            return self._build_result(request.get("id"), {"tools": [], "custom": True})
+
+    request = build_request("tools/list", 3)
+
+    response = CustomCore().handle(request, context=MCPRequestContext(), deps=_make_deps())
+
+    assert response == {"jsonrpc": "2.0", "id": 3, "result": {"tools": [], "custom": True}}
+    default = MCPJSONRPCProtocolCore().handle(request, context=MCPRequestContext(), deps=_make_deps())
+    assert "custom" not in default["result"]
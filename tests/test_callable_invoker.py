@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from toolanything.core.invokers import CallableInvoker
@@ -76,6 +78,27 @@ async def test_callable_invoker_auto_injects_pipeline_context():
     assert state_manager.get("user-1")["echo"] == "hello"
 
 
+@pytest.mark.asyncio
+async def test_callable_invoker_resolves_context_argument_once(monkeypatch):
+    import inspect
+
+    calls = []
+    original_signature = inspect.signature
+
+    def _counting_signature(obj, *args, **kwargs):
+        calls.append(obj)
+        return original_signature(obj, *args, **kwargs)
+
+    invoker = CallableInvoker(_context_echo)
+    monkeypatch.setattr(inspect, "signature", _counting_signature)
+    context = ExecutionContext(tool_name="context.echo", state_manager=StateManager())
+
+    await invoker.invoke({"text": "one"}, context)
+    await invoker.invoke({"text": "two"}, context)
+
+    assert calls.count(_context_echo) == 1
+
+
 def test_tool_spec_from_function_builds_contract_and_callable_invoker():
     spec = ToolSpec.from_function(
         _sync_identity,
@@ -123,3 +146,70 @@ async def test_tool_spec_can_be_invoker_first_without_callable():
     assert result == InvocationResult(
         output={"tool_name": "demo.virtual", "user_id": "u-1", "arguments": {}}
     )
+
+
+def _thread_name(value: str) -> str:
+    import threading
+
+    return f"{value}:{threading.current_thread().name}"
+
+
+@pytest.mark.asyncio
+async def test_callable_invoker_runs_sync_function_on_shared_or_injected_pool():
+    from concurrent.futures import ThreadPoolExecutor
+
+    shared = await CallableInvoker(_thread_name).invoke(
+        {"value": "shared"}, ExecutionContext(tool_name="thread.name")
+    )
+    assert shared.output.startswith("shared:toolanything-sync")
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom-pool") as executor:
+        injected = await CallableInvoker(_thread_name, executor=executor).invoke(
+            {"value": "injected"}, ExecutionContext(tool_name="thread.name")
+        )
+    assert injected.output.startswith("injected:custom-pool")
+
+
+def test_tool_spec_uses_slots_without_instance_dict():
+    spec = ToolSpec.from_function(_sync_identity, name="demo.slots", description="slots")
+
+    assert not hasattr(spec, "__dict__")
+    assert not hasattr(spec.contract, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.name = "renamed"  # type: ignore[misc]
+
+
+def test_nested_sync_tool_call_does_not_deadlock_on_shared_pool(monkeypatch):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from toolanything import tool
+    from toolanything.core.invokers import callable_invoker
+    from toolanything.core.registry import ToolRegistry
+
+    # 只有一個 worker 的共用 pool：巢狀呼叫若再排入同一個 pool 必定死結。
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="toolanything-sync")
+    monkeypatch.setattr(callable_invoker, "_sync_executor", pool)
+    registry = ToolRegistry()
+
+    @tool(name="nested.inner", description="內層", registry=registry)
+    def inner(value: str) -> str:
+        return f"inner:{value}"
+
+    @tool(name="nested.outer", description="外層", registry=registry)
+    def outer(value: str) -> str:
+        return "outer+" + registry.execute_tool("nested.inner", arguments={"value": value})
+
+    results: list[str] = []
+    worker = threading.Thread(
+        target=lambda: results.append(
+            registry.execute_tool("nested.outer", arguments={"value": "x"})
+        ),
+        daemon=True,
+    )
+    worker.start()
+    worker.join(timeout=5)
+    pool.shutdown(wait=False)
+
+    assert not worker.is_alive()
+    assert results == ["outer+inner:x"]
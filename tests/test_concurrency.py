@@ -6,7 +6,9 @@ import pytest
 from toolanything.runtime.concurrency import (
     ParallelOptions,
     RetryPolicy,
+    SimpleRateLimiter,
     parallel_map_async,
+    parallel_map_workers,
     parallel_run,
 )
 
@@ -49,10 +51,23 @@ async def test_retry_policy():
     policy = RetryPolicy(max_retries=3, base_delay=0.01, max_delay=0.05)
     options = ParallelOptions(concurrency=1, retry_policy=policy)
 
-    out = await parallel_run([lambda: unstable()], options=options)
+    out = await parallel_run([unstable], options=options)
     assert out == ["ok"]
 
 
+@pytest.mark.asyncio
+async def test_parallel_run_accepts_awaitables_and_factories():
+    async def echo(value):
+        await asyncio.sleep(0)
+        return value
+
+    out = await parallel_run(
+        [echo("a"), lambda: echo("b"), asyncio.ensure_future(echo("c"))],
+        options=ParallelOptions(concurrency=2),
+    )
+    assert out == ["a", "b", "c"]
+
+
 @pytest.mark.asyncio
 async def test_rate_limit_basic():
     async def fn(x):
@@ -67,3 +82,45 @@ async def test_rate_limit_basic():
 
     assert out == items
     assert elapsed >= 3.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_schedules_concurrent_acquires_by_deadline():
+    limiter = SimpleRateLimiter(rate_limit_per_minute=600)
+
+    start = time.monotonic()
+    stamps = await asyncio.gather(*(_stamp_after_acquire(limiter) for _ in range(3)))
+
+    offsets = sorted(ts - start for ts in stamps)
+    assert offsets[0] < 0.05
+    assert offsets[1] >= 0.09
+    assert offsets[2] >= 0.19
+
+
+async def _stamp_after_acquire(limiter):
+    await limiter.acquire()
+    return time.monotonic()
+
+
+@pytest.mark.asyncio
+async def test_parallel_map_workers_bounds_tasks_and_preserves_order():
+    active = {"now": 0, "peak": 0}
+
+    async def fn(x):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.001 * (x % 3))
+        active["now"] -= 1
+        return x * 2
+
+    items = list(range(20))
+    out = await parallel_map_workers(items, fn, options=ParallelOptions(concurrency=4))
+
+    assert out == [x * 2 for x in items]
+    assert active["peak"] <= 4
+
+    unordered = await parallel_map_workers(
+        items, fn, options=ParallelOptions(concurrency=4, preserve_order=False)
+    )
+    assert sorted(unordered) == [x * 2 for x in items]
+    assert await parallel_map_workers([], fn) == []
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from toolanything import ToolRegistry
@@ -19,6 +21,38 @@ def test_tool_registration_and_metadata():
     assert echo.tool_spec.name == "demo.echo"
 
 
+def test_tool_parameters_are_frozen_and_share_primitive_schemas():
+    registry = ToolRegistry()
+
+    @tool(name="demo.first", description="first", registry=registry)
+    def first(text: str, count: int = 1) -> str:
+        return text * count
+
+    @tool(name="demo.second", description="second", registry=registry)
+    def second(label: str) -> str:
+        return label
+
+    first_params = registry.get_tool("demo.first").parameters
+    second_params = registry.get_tool("demo.second").parameters
+
+    assert first_params["properties"]["text"] is second_params["properties"]["label"]
+    with pytest.raises(TypeError):
+        first_params["properties"]["text"]["type"] = "integer"
+    assert json.loads(json.dumps(first_params))["properties"]["count"] == {"type": "integer", "default": 1}
+
+    for strict in (True, False):
+        exported = registry.get_tool("demo.first").to_openai(strict=strict)["function"]["parameters"]
+        exported["properties"]["text"]["description"] = "edited export"
+        exported["properties"]["extra"] = {"type": "string"}
+    for entry in registry.to_mcp_tools():
+        entry["inputSchema"]["required"].append("zzz")
+        entry["inputSchema"]["properties"]["extra"] = {"type": "string"}
+    assert "zzz" not in first_params["required"]
+    assert "description" not in first_params["properties"]["text"]
+    assert "description" not in second_params["properties"]["label"]
+    assert "extra" not in first_params["properties"]
+
+
 def test_global_registry_auto_registration():
     ToolRegistry._global_instance = None  # type: ignore[attr-defined]
 
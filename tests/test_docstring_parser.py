@@ -32,3 +32,23 @@ def test_docstring_metadata_attached_and_used_in_description():
     assert "使用時機：當需要示範 docstring 擷取時使用" in description
     assert "參數說明：a: 要回傳的數值" in description
     assert "輸出格式：dict，包含 echo 結果" in description
+
+
+def test_parse_docstring_reuses_cached_parse_without_sharing_parameters():
+    from toolanything.utils.docstring_parser import parse_docstring
+
+    def sample(a: int):
+        """示範工具。
+
+        參數:
+            a: 輸入數值
+        回傳: 數值
+        """
+
+    first = parse_docstring(sample)
+    first.parameters["a"] = "patched"
+    second = parse_docstring(sample)
+
+    assert second.summary == "示範工具。"
+    assert second.parameters == {"a": "輸入數值"}
+    assert second.returns == "數值"
@@ -10,6 +10,7 @@ from examples.tool_selection.hf_dataset_exporter import (
     OptionalDependencyNotAvailable,
     export_dataset_split,
 )
+from tests.fixtures.ndjson import iter_ndjson
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -89,7 +90,7 @@ def test_export_dataset_split_still_supports_jsonl_output(tmp_path):
         module_loader=lambda name: _FakeDatasetsModule if name == "datasets" else None,
     )
 
-    rows = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    rows = list(iter_ndjson(output_path.read_text(encoding="utf-8")))
     assert len(rows) == 2
     assert result["format"] == "jsonl"
 
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from toolanything.utils.json_tools import from_json, to_json, to_json_bytes
+
+
+def test_to_json_bytes_round_trips_and_keeps_unicode():
+    payload = {"name": "工具", "items": [1, 2.5, None, True], "nested": {"k": "v"}}
+
+    body = to_json_bytes(payload)
+
+    assert isinstance(body, bytes)
+    assert "工具".encode("utf-8") in body
+    assert json.loads(body) == payload
+
+
+def test_to_json_bytes_falls_back_for_unsupported_values():
+    payload = {"big": 2**70, 1: "int-key"}
+
+    assert json.loads(to_json_bytes(payload)) == {"big": 2**70, "1": "int-key"}
+
+
+def test_to_json_matches_indented_stdlib_output():
+    payload = {"mcpServers": {"demo": {"command": "python", "args": ["-m", "工具"]}}}
+
+    assert to_json(payload) == json.dumps(payload, ensure_ascii=False, indent=2)
+    assert from_json(to_json(payload)) == payload
+
+
+def test_from_json_accepts_stdlib_only_values_and_rejects_invalid_input():
+    assert from_json('{"big": 1180591620717411303424, "nan": NaN}')["big"] == 2**70
+    assert from_json(b'{"name": "\xe5\xb7\xa5\xe5\x85\xb7"}') == {"name": "工具"}
+    with pytest.raises(json.JSONDecodeError):
+        from_json("{bad")
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    from toolanything.utils import json_tools
+
+    if request.param == "orjson":
+        if json_tools.orjson is None:
+            pytest.skip("orjson 未安裝")
+    else:
+        monkeypatch.setattr(json_tools, "orjson", None)
+    return request.param
+
+
+def test_serializers_match_stdlib_for_non_finite_floats(json_backend):
+    payload = {"nan": float("nan"), "items": [None, float("inf"), -float("inf")]}
+
+    assert to_json_bytes(payload) == json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    assert to_json(payload) == json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def test_serializers_reject_datetime_and_dataclass_like_stdlib(json_backend):
+    import dataclasses
+    import datetime
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+
+    for value in (datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 1), Point(1)):
+        with pytest.raises(TypeError):
+            to_json_bytes({"value": value})
+        with pytest.raises(TypeError):
+            to_json([value])
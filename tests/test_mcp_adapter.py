@@ -43,3 +43,29 @@ async def test_mcp_adapter_masks_sensitive_arguments():
     assert invocation["arguments"] == {"a": 1, "api_key": "***MASKED***"}
 
 
+
+
+def test_mcp_adapter_tools_body_cached_until_registry_changes():
+    import json
+
+    from toolanything import ToolRegistry
+    from toolanything.decorators import tool
+
+    local_registry = ToolRegistry()
+
+    @tool(name="cache.first", description="first", registry=local_registry)
+    def first(text: str) -> str:
+        return text
+
+    adapter = MCPAdapter(local_registry)
+    body = adapter.to_tools_body_bytes()
+    assert adapter.to_tools_body_bytes() is body
+    assert json.loads(body) == {"tools": local_registry.to_mcp_tools()}
+
+    @tool(name="cache.second", description="second", registry=local_registry)
+    def second(text: str) -> str:
+        return text
+
+    refreshed = adapter.to_tools_body_bytes()
+    assert refreshed is not body
+    assert [entry["name"] for entry in json.loads(refreshed)["tools"]] == ["cache.first", "cache.second"]
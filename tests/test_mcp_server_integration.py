@@ -1,10 +1,11 @@
 import http.client
 import io
 import json
+import os
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from http.server import ThreadingHTTPServer
-from types import MethodType
 
 import pytest
 
@@ -24,11 +25,38 @@ from toolanything.server.mcp_streamable_http import (
 from toolanything.server.mcp_stdio_server import MCPStdioServer
 from toolanything.server.mcp_tool_server import _build_handler
 from toolanything.state import StateManager
+from tests.fixtures.ndjson import iter_ndjson
 
 
-@pytest.fixture()
+def _raise_tool_error(arguments):
+    raise ToolError("boom", error_type="bad_request", data={"hint": "nope"})
+
+
+def _raise_runtime_error(arguments):
+    raise RuntimeError("crash")
+
+
+# 需要在 registry 之外直接失敗的工具名稱 -> 對應的 stub。
+_STUB_HANDLERS = {
+    "fail": _raise_tool_error,
+    "explode": _raise_runtime_error,
+}
+
+
+class _TestToolRegistry(ToolRegistry):
+    """同步 execute_tool 遇到 stub 名稱時直接失敗，其餘交回 ToolRegistry。"""
+
+    def execute_tool(self, name: str, *, arguments=None, **kwargs):
+        arguments = arguments or {}
+        handler = _STUB_HANDLERS.get(name)
+        if handler is not None:
+            return handler(arguments)
+        return super().execute_tool(name, arguments=arguments, **kwargs)
+
+
+@pytest.fixture(scope="module")
 def registry_with_tools():
-    registry = ToolRegistry()
+    registry = _TestToolRegistry()
     state_manager = StateManager()
 
     @tool(name="echo", description="Echo message", registry=registry)
@@ -53,96 +81,174 @@ def registry_with_tools():
         ctx.set("remembered", value)
         return {"remembered": ctx.get("remembered")}
 
-    def execute_tool_stub(self, name: str, *, arguments=None, user_id=None, state_manager=None, failure_log=None):
-        arguments = arguments or {}
-        if name == "fail":
-            raise ToolError("boom", error_type="bad_request", data={"hint": "nope"})
-        if name == "explode":
-            raise RuntimeError("crash")
-        return ToolRegistry.execute_tool(
-            self,
-            name,
-            arguments=arguments,
-            user_id=user_id,
-            state_manager=state_manager,
-            failure_log=failure_log,
+    return registry, state_manager
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """以固定大小的 thread pool 處理請求，避免每個連線都建立新 thread。
+
+    僅供測試使用：legacy SSE 的 /sse 會長時間占用 worker，正式 server 仍用 ThreadingHTTPServer。
+    """
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 2),
+            thread_name_prefix="mcp-http",
         )
 
-    registry.execute_tool = MethodType(execute_tool_stub, registry)
+    def process_request(self, request, client_address):
+        self._pool.submit(self.process_request_thread, request, client_address)
 
-    return registry, state_manager
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
 
 def start_http_server(registry: ToolRegistry):
     handler_cls = _build_handler(registry, host="127.0.0.1", port=0)
-    server = ThreadingHTTPServer(("localhost", 0), handler_cls)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server = PooledHTTPServer(("localhost", 0), handler_cls)
+    # 縮短 serve_forever 的輪詢間隔，shutdown() 不必等滿預設的 0.5 秒。
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
     thread.start()
     return server, thread
 
 
-def test_mcp_http_server_endpoints(registry_with_tools):
+@pytest.fixture(scope="module")
+def http_server(registry_with_tools):
     registry, _ = registry_with_tools
     server, thread = start_http_server(registry)
-    port = server.server_address[1]
+    try:
+        yield server, server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=3)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 各測試共用的固定請求內容，於模組載入時序列化一次。
+_ECHO_BODY = json.dumps({"name": "echo", "arguments": {"message": "hi"}})
+_BAD_JSON = "{bad"
+_MISSING_NAME = json.dumps({"arguments": {}})
+_FAIL_BODY = json.dumps({"name": "fail", "arguments": {"api_key": "secret"}})
+_MISSING_TOOL = json.dumps({"name": "missing"})
+_INITIALIZE_BODY = json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {"protocolVersion": "2025-11-25"},
+    }
+)
+_TOOLS_LIST_BODY = json.dumps({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+_REMEMBER_BODY = json.dumps({"name": "remember", "arguments": {"value": "hello"}, "user_id": "user-http"})
+_STDIO_INPUT = "".join(
+    json.dumps(request, ensure_ascii=False) + "\n"
+    for request in (
+        build_request(MCP_METHOD_INITIALIZE, 1),
+        build_request(MCP_METHOD_TOOLS_LIST, 2),
+        build_request(
+            MCP_METHOD_TOOLS_CALL,
+            3,
+            params={"name": "echo", "arguments": {"message": "world"}},
+        ),
+        build_request(
+            MCP_METHOD_TOOLS_CALL,
+            4,
+            params={"name": "fail", "arguments": {"api_key": "top-secret"}},
+        ),
+    )
+)
+
+
+def _request_json(conn, method, path, payload=None, *, headers=None):
+    """在同一條 keep-alive 連線上送出請求，回傳 response 與解析後的 JSON body。"""
+
+    body = payload if payload is None or isinstance(payload, str) else json.dumps(payload)
+    request_headers = _JSON_HEADERS if headers is None else {**_JSON_HEADERS, **headers}
+    conn.request(method, path, body=body, headers=request_headers)
+    resp = conn.getresponse()
+    return resp, json.loads(resp.read())
+
+
+def _check_root(body):
+    assert body["status"] == "ok"
+    assert body["transport"] == "legacy_sse"
+    assert body["mcp"]["sse"] == "/sse"
+    assert body["mcp"]["messages"] == "/messages/{session_id}"
+
+
+def _check_health(body):
+    assert body["status"] == "ok"
+
+
+def _check_tools(body):
+    assert any(tool["name"] == "echo" for tool in body["tools"])
+
+
+def _check_echo(body):
+    assert body["result"] == {"contentType": "application/json", "content": {"echo": "hi"}}
+    assert body["audit"]["tool"] == "echo"
+
+
+def _check_invalid_json(body):
+    assert body["error"] == "invalid_json"
+
+
+def _check_missing_name(body):
+    assert body["error"] == "missing_name"
+
+
+def _check_fail(body):
+    assert body["error"]["type"] == "bad_request"
+    assert body["arguments"]["api_key"] == "***MASKED***"
+
+
+def _check_missing_tool(body):
+    assert body["error"]["type"] == "internal_error"
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "payload", "expected_status", "check"),
+    [
+        pytest.param("GET", "/", None, 200, _check_root, id="root"),
+        pytest.param("GET", "/health", None, 200, _check_health, id="health"),
+        pytest.param("GET", "/tools", None, 200, _check_tools, id="tools"),
+        pytest.param("POST", "/invoke", _ECHO_BODY, 200, _check_echo, id="invoke-echo"),
+        pytest.param("POST", "/invoke", _BAD_JSON, 400, _check_invalid_json, id="invalid-json"),
+        pytest.param("POST", "/invoke", _MISSING_NAME, 400, _check_missing_name, id="missing-name"),
+        pytest.param("POST", "/invoke", _FAIL_BODY, 400, _check_fail, id="tool-error"),
+        pytest.param("POST", "/invoke", _MISSING_TOOL, 500, _check_missing_tool, id="missing-tool"),
+    ],
+)
+def test_mcp_http_server_endpoints(http_server, method, path, payload, expected_status, check):
+    _, port = http_server
     conn = http.client.HTTPConnection("localhost", port, timeout=5)
 
     try:
-        conn.request("GET", "/")
-        resp = conn.getresponse()
-        root_body = json.loads(resp.read())
-        assert resp.status == 200
-        assert root_body["status"] == "ok"
-        assert root_body["transport"] == "legacy_sse"
-        assert root_body["mcp"]["sse"] == "/sse"
-        assert root_body["mcp"]["messages"] == "/messages/{session_id}"
-
-        conn.request("GET", "/health")
-        resp = conn.getresponse()
-        body = json.loads(resp.read())
-        assert resp.status == 200
-        assert body["status"] == "ok"
-
-        conn.request("GET", "/tools")
-        resp = conn.getresponse()
-        tools_body = json.loads(resp.read())
-        assert resp.status == 200
-        assert any(tool["name"] == "echo" for tool in tools_body["tools"])
+        resp, body = _request_json(conn, method, path, payload)
+        assert resp.status == expected_status
+        check(body)
+    finally:
+        conn.close()
 
-        payload = json.dumps({"name": "echo", "arguments": {"message": "hi"}})
-        conn.request("POST", "/invoke", body=payload, headers={"Content-Type": "application/json"})
-        resp = conn.getresponse()
-        invoke_body = json.loads(resp.read())
-        assert resp.status == 200
-        assert invoke_body["result"] == {"contentType": "application/json", "content": {"echo": "hi"}}
-        assert invoke_body["audit"]["tool"] == "echo"
 
-        invalid_body = "{bad"
-        conn.request("POST", "/invoke", body=invalid_body, headers={"Content-Type": "application/json"})
-        resp = conn.getresponse()
-        error_body = json.loads(resp.read())
-        assert resp.status == 400
-        assert error_body["error"] == "invalid_json"
+def test_mcp_http_server_streamable_session_on_root(http_server):
+    _, port = http_server
+    conn = http.client.HTTPConnection("localhost", port, timeout=5)
 
-        conn.request(
+    try:
+        resp, initialize_body = _request_json(
+            conn,
             "POST",
             "/",
-            body=json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "initialize",
-                    "params": {"protocolVersion": "2025-11-25"},
-                }
-            ),
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                MCP_PROTOCOL_VERSION_HEADER: "2025-11-25",
-            },
+            _INITIALIZE_BODY,
+            headers={"Accept": "application/json", MCP_PROTOCOL_VERSION_HEADER: "2025-11-25"},
         )
-        resp = conn.getresponse()
-        initialize_body = json.loads(resp.read())
         session_id = resp.getheader(MCP_SESSION_ID_HEADER)
         protocol_version = resp.getheader(MCP_PROTOCOL_VERSION_HEADER)
         assert resp.status == 200
@@ -150,104 +256,54 @@ def test_mcp_http_server_endpoints(registry_with_tools):
         assert session_id
         assert protocol_version == "2025-11-25"
 
-        conn.request(
+        resp, mcp_tools_body = _request_json(
+            conn,
             "POST",
             "/mcp",
-            body=json.dumps({"jsonrpc": "2.0", "id": 2, "method": "tools/list"}),
+            _TOOLS_LIST_BODY,
             headers={
-                "Content-Type": "application/json",
                 "Accept": "application/json",
                 MCP_SESSION_ID_HEADER: session_id,
                 MCP_PROTOCOL_VERSION_HEADER: protocol_version,
             },
         )
-        resp = conn.getresponse()
-        mcp_tools_body = json.loads(resp.read())
         assert resp.status == 200
         assert any(tool["name"] == "echo" for tool in mcp_tools_body["result"]["tools"])
-
-        conn.request("POST", "/invoke", body=json.dumps({"arguments": {}}), headers={"Content-Type": "application/json"})
-        resp = conn.getresponse()
-        missing_name_body = json.loads(resp.read())
-        assert resp.status == 400
-        assert missing_name_body["error"] == "missing_name"
-
-        conn.request(
-            "POST",
-            "/invoke",
-            body=json.dumps({"name": "fail", "arguments": {"api_key": "secret"}}),
-            headers={"Content-Type": "application/json"},
-        )
-        resp = conn.getresponse()
-        fail_body = json.loads(resp.read())
-        assert resp.status == 400
-        assert fail_body["error"]["type"] == "bad_request"
-        assert fail_body["arguments"]["api_key"] == "***MASKED***"
-
-        conn.request("POST", "/invoke", body=json.dumps({"name": "missing"}), headers={"Content-Type": "application/json"})
-        resp = conn.getresponse()
-        missing_body = json.loads(resp.read())
-        assert resp.status == 500
-        assert missing_body["error"]["type"] == "internal_error"
     finally:
         conn.close()
-        server.shutdown()
-        server.server_close()
-        thread.join(timeout=3)
 
 
-def test_mcp_http_server_rejects_disallowed_origin(registry_with_tools):
-    registry, _ = registry_with_tools
-    server, thread = start_http_server(registry)
-    port = server.server_address[1]
+def test_mcp_http_server_rejects_disallowed_origin(http_server):
+    _, port = http_server
     conn = http.client.HTTPConnection("localhost", port, timeout=5)
 
     try:
-        conn.request(
-            "GET",
-            "/health",
-            headers={"Origin": "https://evil.example"},
-        )
-        resp = conn.getresponse()
-        body = json.loads(resp.read())
+        resp, body = _request_json(conn, "GET", "/health", headers={"Origin": "https://evil.example"})
         assert resp.status == 403
         assert body["error"] == "origin_not_allowed"
     finally:
         conn.close()
-        server.shutdown()
-        server.server_close()
-        thread.join(timeout=3)
 
 
-def test_mcp_stdio_server_flow(monkeypatch, registry_with_tools):
+@pytest.mark.parametrize("binary", [True, False], ids=["binary-buffer", "text-only"])
+def test_mcp_stdio_server_flow(monkeypatch, registry_with_tools, binary):
     registry, _ = registry_with_tools
     server = MCPStdioServer(registry)
 
-    requests = [
-        build_request(MCP_METHOD_INITIALIZE, 1),
-        build_request(MCP_METHOD_TOOLS_LIST, 2),
-        build_request(
-            MCP_METHOD_TOOLS_CALL,
-            3,
-            params={"name": "echo", "arguments": {"message": "world"}},
-        ),
-        build_request(
-            MCP_METHOD_TOOLS_CALL,
-            4,
-            params={"name": "fail", "arguments": {"api_key": "top-secret"}},
-        ),
-    ]
-
-    input_data = "\n".join(json.dumps(r, ensure_ascii=False) for r in requests) + "\n"
-    fake_stdin = io.StringIO(input_data)
-    fake_stdout = io.StringIO()
+    if binary:
+        fake_stdin = io.TextIOWrapper(io.BytesIO(_STDIO_INPUT.encode("utf-8")), encoding="utf-8")
+        fake_stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    else:
+        fake_stdin = io.StringIO(_STDIO_INPUT)
+        fake_stdout = io.StringIO()
 
     monkeypatch.setattr(sys, "stdin", fake_stdin)
     monkeypatch.setattr(sys, "stdout", fake_stdout)
 
     server.run()
 
-    output_lines = [json.loads(line) for line in fake_stdout.getvalue().strip().splitlines()]
+    output = fake_stdout.buffer.getvalue().decode("utf-8") if binary else fake_stdout.getvalue()
+    output_lines = list(iter_ndjson(output))
     assert output_lines[0]["result"]["protocolVersion"]
     assert any(tool["name"] == "echo" for tool in output_lines[1]["result"]["tools"])
 
@@ -260,19 +316,13 @@ def test_mcp_stdio_server_flow(monkeypatch, registry_with_tools):
     assert fail_response["data"]["arguments"]["api_key"] == "***MASKED***"
 
 
-def test_mcp_http_invoke_pipeline_persists_state(registry_with_tools):
-    registry, state_manager = registry_with_tools
-    server, thread = start_http_server(registry)
-    port = server.server_address[1]
+def test_mcp_http_invoke_pipeline_persists_state(registry_with_tools, http_server):
+    _, state_manager = registry_with_tools
+    _, port = http_server
     conn = http.client.HTTPConnection("localhost", port, timeout=5)
 
     try:
-        payload = json.dumps(
-            {"name": "remember", "arguments": {"value": "hello"}, "user_id": "user-http"}
-        )
-        conn.request("POST", "/invoke", body=payload, headers={"Content-Type": "application/json"})
-        resp = conn.getresponse()
-        invoke_body = json.loads(resp.read())
+        resp, invoke_body = _request_json(conn, "POST", "/invoke", _REMEMBER_BODY)
         assert resp.status == 200
         assert invoke_body["result"] == {
             "contentType": "application/json",
@@ -281,6 +331,3 @@ def test_mcp_http_invoke_pipeline_persists_state(registry_with_tools):
         assert state_manager.get("user-http")["remembered"] == "hello"
     finally:
         conn.close()
-        server.shutdown()
-        server.server_close()
-        thread.join(timeout=3)
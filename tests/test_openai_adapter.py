@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from toolanything import tool
@@ -18,13 +20,9 @@ def test_openai_function_call_payload():
     adapter = OpenAIAdapter(registry)
     payload = adapter.to_function_call("math.add", {"a": 3})
 
-    assert payload == {
-        "type": "function",
-        "function": {
-            "name": "math_add",
-            "arguments": "{\"a\": 3}",
-        },
-    }
+    assert payload["type"] == "function"
+    assert payload["function"]["name"] == "math_add"
+    assert json.loads(payload["function"]["arguments"]) == {"a": 3}
 
 
 @pytest.mark.asyncio
@@ -84,3 +82,24 @@ def test_openai_adapter_deduplicates_colliding_safe_names():
     assert len(exported_names) == len(set(exported_names))
     assert adapter.from_openai_name("math_add") == "math_add"
     assert adapter.from_openai_name(adapter.to_openai_name("math.add")) == "math.add"
+
+
+def test_openai_adapter_name_mappings_refresh_when_registry_changes():
+    local_registry = ToolRegistry()
+
+    @tool(name="math.add", description="dot tool", registry=local_registry)
+    def dot_tool() -> str:
+        return "dot"
+
+    adapter = OpenAIAdapter(local_registry)
+    first = adapter._build_name_mappings()
+    assert adapter._build_name_mappings() is first
+    assert adapter.to_openai_name("math.add") == "math_add"
+
+    @tool(name="math_add", description="underscore tool", registry=local_registry)
+    def underscore_tool() -> str:
+        return "underscore"
+
+    assert adapter._build_name_mappings() is not first
+    assert adapter.from_openai_name(adapter.to_openai_name("math.add")) == "math.add"
+    assert adapter.from_openai_name("math_add") == "math_add"
@@ -27,3 +27,25 @@ async def test_pipeline_context_async_access_with_async_state_manager():
 
     await ctx.aset("beta", "value")
     assert await ctx.aget("beta") == "value"
+
+
+def test_pipeline_context_sync_access_closes_its_event_loop():
+    import asyncio
+    import threading
+
+    loops = []
+
+    class LoopRecordingStateManager(StateManager):
+        async def get(self, user_id):
+            loops.append(asyncio.get_running_loop())
+            return {"seen": len(loops)}
+
+    ctx = PipelineContext(LoopRecordingStateManager(), user_id="u4")
+
+    assert ctx.get("seen") == 1
+    worker = threading.Thread(target=ctx.get, args=("seen",))
+    worker.start()
+    worker.join()
+
+    assert len(loops) == 2
+    assert all(loop.is_closed() for loop in loops)
@@ -1,3 +1,5 @@
+import pytest
+
 from toolanything.core.models import PipelineDefinition, ToolSpec
 from toolanything.core.registry import ToolRegistry
 
@@ -46,3 +48,48 @@ def test_registry_lookup_cache_and_invalidation():
         registry.get_pipeline("demo.pipeline"),
     )
 
+
+
+def test_bulk_register_defers_invalidation_until_exit():
+    registry = ToolRegistry()
+    registry.register(
+        ToolSpec(name="demo.first", description="first", func=sample_tool, parameters={})
+    )
+    registry.get("demo.first")
+    version = registry.version
+
+    with registry.bulk_register():
+        registry.register(
+            ToolSpec(name="demo.second", description="second", func=sample_tool, parameters={})
+        )
+        registry.register_pipeline(
+            PipelineDefinition(
+                name="demo.pipeline",
+                description="Demo pipeline",
+                func=sample_pipeline,
+                parameters={},
+                stateful=False,
+            )
+        )
+        assert registry.version == version
+        assert ("tool", "demo.first") in registry._lookup_cache
+
+    assert registry.version == version + 1
+    assert registry._lookup_cache == {}
+    assert registry.get("demo.second") is sample_tool
+
+
+def test_unregister_inside_bulk_register_invalidates_immediately():
+    registry = ToolRegistry()
+    registry.register(ToolSpec(name="demo.gone", description="gone", func=sample_tool, parameters={}))
+    assert registry.get("tool:demo.gone") is sample_tool
+    version = registry.version
+
+    with registry.bulk_register():
+        registry.unregister("demo.gone")
+
+        assert registry.version == version + 1
+        with pytest.raises(KeyError):
+            registry.get("tool:demo.gone")
+        with pytest.raises(KeyError):
+            registry.get("demo.gone")
@@ -5,7 +5,10 @@ from toolanything.pipeline import PipelineContext
 from toolanything.state.manager import StateManager
 
 
-def test_type_prefix_lookup_and_registration():
+@pytest.fixture(scope="module")
+def namespaced_registry():
+    """只供唯讀測試共用；會註冊或移除工具的測試仍各自建立 ToolRegistry。"""
+
     registry = ToolRegistry()
 
     @tool(name="tool:echo", description="echo", registry=registry)
@@ -17,6 +20,12 @@ def test_type_prefix_lookup_and_registration():
     def transform(ctx: PipelineContext, text: str) -> dict:
         return {"text": text, "user": ctx.user_id}
 
+    return registry
+
+
+def test_type_prefix_lookup_and_registration(namespaced_registry):
+    registry = namespaced_registry
+
     tool_spec = registry.get_tool("tool:echo")
     pipeline_spec = registry.get_pipeline("pipeline:transform")
 
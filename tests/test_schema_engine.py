@@ -1,4 +1,7 @@
-import inspect
+from enum import Enum
+from typing import Dict, List, Literal, Optional, Union
+
+import pytest
 
 from toolanything.core import schema
 from toolanything.core.schema import build_parameters_schema, python_type_to_schema
@@ -8,59 +11,51 @@ def sample(a: int, b: str, c: float = 1.0):
     return a, b, c
 
 
-def test_python_type_to_schema_basic():
-    assert python_type_to_schema(int) == {"type": "integer"}
-    assert python_type_to_schema(str) == {"type": "string"}
-    assert python_type_to_schema(list) == {"type": "array"}
-
-
-def test_python_type_to_schema_complex_types():
-    from typing import Dict, List, Literal, Optional, Union
-    from enum import Enum
-
-    assert python_type_to_schema(bool) == {"type": "boolean"}
-    assert python_type_to_schema(float) == {"type": "number"}
-
-    union_schema = python_type_to_schema(Union[int, str])
-    assert union_schema == {
-        "oneOf": [
-            {"type": "integer"},
-            {"type": "string"},
-        ]
-    }
-
-    optional_schema = python_type_to_schema(Optional[int])
-    assert optional_schema == {
-        "oneOf": [
-            {"type": "integer"},
-            {"type": "null"},
-        ]
-    }
-
-    nested_list_schema = python_type_to_schema(List[List[int]])
-    assert nested_list_schema == {
-        "type": "array",
-        "items": {"type": "array", "items": {"type": "integer"}},
-    }
-
-    nested_dict_schema = python_type_to_schema(Dict[str, List[int]])
-    assert nested_dict_schema == {
-        "type": "object",
-        "additionalProperties": {
-            "type": "array",
-            "items": {"type": "integer"},
-        },
-    }
-
-    literal_schema = python_type_to_schema(Literal["red", "blue"])
-    assert literal_schema == {"enum": ["red", "blue"]}
-
-    class Status(Enum):
-        READY = "ready"
-        DONE = "done"
-
-    enum_schema = python_type_to_schema(Status)
-    assert enum_schema == {"type": "string", "enum": ["ready", "done"]}
+class Status(Enum):
+    READY = "ready"
+    DONE = "done"
+
+
+@pytest.mark.parametrize(
+    ("py_type", "expected"),
+    [
+        (int, {"type": "integer"}),
+        (str, {"type": "string"}),
+        (list, {"type": "array"}),
+        (bool, {"type": "boolean"}),
+        (float, {"type": "number"}),
+        (Union[int, str], {"oneOf": [{"type": "integer"}, {"type": "string"}]}),
+        (Optional[int], {"oneOf": [{"type": "integer"}, {"type": "null"}]}),
+        (
+            List[List[int]],
+            {"type": "array", "items": {"type": "array", "items": {"type": "integer"}}},
+        ),
+        (
+            Dict[str, List[int]],
+            {
+                "type": "object",
+                "additionalProperties": {"type": "array", "items": {"type": "integer"}},
+            },
+        ),
+        (Literal["red", "blue"], {"enum": ["red", "blue"]}),
+        (Status, {"type": "string", "enum": ["ready", "done"]}),
+    ],
+    ids=[
+        "int",
+        "str",
+        "list",
+        "bool",
+        "float",
+        "union",
+        "optional",
+        "nested-list",
+        "nested-dict",
+        "literal",
+        "enum",
+    ],
+)
+def test_python_type_to_schema(py_type, expected):
+    assert python_type_to_schema(py_type) == expected
 
 
 def test_python_type_to_schema_cache_and_copy():
@@ -104,3 +99,72 @@ def test_build_parameters_schema_skips_self_and_cls():
 
     class_schema = build_parameters_schema(Demo.class_method.__func__)
     assert set(class_schema["properties"].keys()) == {"text"}
+
+
+def test_build_parameters_schema_cache_returns_independent_copies():
+    first = build_parameters_schema(sample)
+    first["properties"]["a"]["patched"] = True
+    first["required"].append("c")
+
+    second = build_parameters_schema(sample)
+    assert "patched" not in second["properties"]["a"]
+    assert second["required"] == ["a", "b"]
+    assert schema._PARAMETERS_SCHEMA_CACHE.get(sample) is not None
+
+
+def test_strict_schema_from_frozen_input_is_plain_and_mutable():
+    raw = build_parameters_schema(sample)
+    frozen = schema.freeze_schema(raw)
+
+    strict = schema.to_openai_strict_schema(frozen)
+
+    assert strict == schema.to_openai_strict_schema(raw)
+    assert type(strict) is dict and type(strict["properties"]["a"]) is dict
+    strict["properties"]["a"]["description"] = "edited"
+    assert "description" not in frozen["properties"]["a"]
+    assert frozen["required"] == raw["required"]
+
+
+def test_python_type_to_schema_copies_nested_structure():
+    first = python_type_to_schema(Optional[Dict[str, List[int]]])
+    first["oneOf"][0]["additionalProperties"]["items"]["patched"] = True
+    first["oneOf"].append({"type": "string"})
+
+    second = python_type_to_schema(Optional[Dict[str, List[int]]])
+    assert second == {
+        "oneOf": [
+            {"type": "object", "additionalProperties": {"type": "array", "items": {"type": "integer"}}},
+            {"type": "null"},
+        ]
+    }
+    assert python_type_to_schema(List[int]) == {"type": "array", "items": {"type": "integer"}}
+
+
+def test_frozen_parameters_schema_is_shared_per_function():
+    from toolanything.core.models import ToolSpec
+
+    first = ToolSpec.from_function(sample, name="demo.first", description="first")
+    second = ToolSpec.from_function(sample, name="demo.second", description="second")
+
+    assert first.parameters is second.parameters
+    assert first.parameters is schema.frozen_parameters_schema(sample)
+
+    mutable = build_parameters_schema(sample)
+    mutable["properties"]["a"]["type"] = "string"
+    assert first.parameters["properties"]["a"] == {"type": "integer"}
+
+
+def test_frozen_parameters_schema_lists_are_read_only():
+    from toolanything.core.models import ToolSpec
+
+    first = ToolSpec.from_function(sample, name="demo.first", description="first")
+    second = ToolSpec.from_function(sample, name="demo.second", description="second")
+
+    with pytest.raises(TypeError):
+        first.parameters["required"].append("zzz")
+
+    exported = first.to_openai()["function"]["parameters"]
+    exported["required"].append("zzz")
+    assert type(exported["required"]) is list
+    assert second.parameters["required"] == ["a", "b"]
+    assert schema.frozen_parameters_schema(sample)["required"] == ["a", "b"]
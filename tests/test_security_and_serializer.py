@@ -36,6 +36,30 @@ def test_security_manager_masks_nested_sensitive_values():
     assert masked["public"] == "ok"
 
 
+def test_security_manager_masks_by_suffix_and_honours_subclass_suffixes():
+    record = {"X-Session-Cookie": "c", "clientSecret": "s", "keyboard": "qwerty"}
+
+    masked = SecurityManager().mask_keys_in_log(record)
+
+    assert masked == {"X-Session-Cookie": "***MASKED***", "clientSecret": "***MASKED***", "keyboard": "qwerty"}
+
+    class PinManager(SecurityManager):
+        _SENSITIVE_SUFFIXES = SecurityManager._SENSITIVE_SUFFIXES + ("pin",)
+
+    assert PinManager().mask_keys_in_log({"userPin": "1234"}) == {"userPin": "***MASKED***"}
+
+
+def test_security_manager_audit_reuses_masked_args():
+    manager = SecurityManager()
+    record = {"token": "abc", "query": "hello"}
+    masked = manager.mask_keys_in_log(record)
+
+    audit = manager.audit_call("demo.tool", record, user="bob", masked_args=masked)
+
+    assert audit["args"] is masked
+    assert audit == manager.audit_call("demo.tool", record, user="bob")
+
+
 def test_result_serializer_outputs():
     serializer = ResultSerializer()
 
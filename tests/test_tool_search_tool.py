@@ -41,6 +41,101 @@ def test_failure_log_manager_records_and_calculates(tmp_path):
     assert decayed < latest_score
 
 
+def test_failure_log_manager_appends_events_and_compacts(tmp_path):
+    log_path = tmp_path / ".tool_failures.json"
+    manager = FailureLogManager(log_path, compact_every=2)
+
+    manager.record_failure("demo", timestamp=1.0)
+    assert log_path.exists()
+    assert not manager.journal_path.exists()
+
+    manager.record_failure("other", timestamp=2.0)
+    assert len(manager.journal_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    with manager.journal_path.open("a", encoding="utf-8") as journal:
+        journal.write('{"name": "demo"')
+    assert FailureLogManager(log_path).get_record("other")["count"] == 1
+    assert not manager.journal_path.exists()
+
+    manager.record_failure("demo", timestamp=3.0)
+
+    assert not manager.journal_path.exists()
+    reloaded = FailureLogManager(log_path)
+    assert reloaded.get_record("demo") == {"count": 2, "last_failed": 3.0, "recent": [1.0, 3.0], "last_seq": 3}
+
+    reloaded.reset()
+    assert FailureLogManager(log_path).get_record("demo") is None
+
+
+def test_failure_log_manager_journal_never_collides_and_skips_incomplete_events(tmp_path):
+    log_path = tmp_path / "failures.ndjson"
+    manager = FailureLogManager(log_path)
+    assert manager.journal_path != log_path
+
+    manager.record_failure("demo", timestamp=1.0)
+    manager.compact()
+    manager.record_failure("demo", timestamp=2.0)
+    with manager.journal_path.open("a", encoding="utf-8") as journal:
+        journal.write('{"tool": "demo"}\n[1, 2]\n')
+
+    reloaded = FailureLogManager(log_path)
+    assert reloaded.get_record("demo")["count"] == 2
+    assert not reloaded.journal_path.exists()
+
+
+def test_failure_log_manager_coalesces_journal_writes(tmp_path):
+    import gc
+
+    log_path = tmp_path / ".tool_failures.json"
+    manager = FailureLogManager(log_path, flush_interval=60.0)
+    journal_path = manager.journal_path
+
+    manager.record_failure("demo", timestamp=1.0)
+    manager.record_failure("demo", timestamp=2.0)
+    assert not journal_path.exists()
+
+    assert log_path.exists()
+
+    manager.flush()
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    manager.record_failure("demo", timestamp=3.0)
+    del manager
+    gc.collect()
+
+    assert FailureLogManager(log_path).get_record("demo")["count"] == 3
+
+
+def test_failure_log_manager_flushes_after_k_buffered_events(tmp_path):
+    log_path = tmp_path / ".tool_failures.json"
+    manager = FailureLogManager(log_path, flush_interval=60.0, flush_every=2)
+    journal_path = manager.journal_path
+
+    manager.record_failure("demo", timestamp=1.0)
+    manager.record_failure("demo", timestamp=2.0)
+    assert not journal_path.exists()
+
+    manager.record_failure("demo", timestamp=3.0)
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_failure_score_by_interaction_decays_per_event(tmp_path):
+    log_path = tmp_path / ".tool_failures.json"
+    manager = FailureLogManager(log_path, decay_base=0.5)
+
+    manager.record_failure("flaky", timestamp=1.0)
+    manager.record_failure("flaky", timestamp=2.0)
+    assert manager.failure_score_by_interaction("flaky") == pytest.approx(2.0)
+
+    manager.record_failure("other", timestamp=3.0)
+    manager.record_failure("other", timestamp=4.0)
+    assert manager.failure_score_by_interaction("flaky") == pytest.approx(0.5)
+    assert manager.failure_score_by_interaction("flaky", seq=2) == pytest.approx(2.0)
+    assert manager.failure_score_by_interaction("missing") == 0.0
+
+    assert FailureLogManager(log_path, decay_base=0.5).failure_score_by_interaction("flaky") == pytest.approx(0.5)
+
+
 def test_tool_search_filters_and_sorts_by_failure():
     registry = ToolRegistry()
     registry.register(
@@ -75,6 +170,10 @@ def test_tool_search_filters_and_sorts_by_failure():
     results = searcher.search(query="translate", tags=["lang"], top_k=2, now=500.0)
     assert [spec.name for spec in results] == ["translate.audio", "translate.text"]
 
+    by_interaction = ToolSearchTool(registry, failure_log, decay_axis="interaction")
+    results = by_interaction.search(query="translate", tags=["lang"], top_k=2)
+    assert [spec.name for spec in results] == ["translate.audio", "translate.text"]
+
     prefixed = searcher.search(prefix="translate.", now=500.0)
     assert all(spec.name.startswith("translate.") for spec in prefixed)
     assert any(spec.name == "translate.text" for spec in prefixed)
@@ -156,3 +255,100 @@ def test_search_ranking_prefers_cost_latency_when_tied():
     searcher = ToolSearchTool(registry, FailureLogManager())
     results = searcher.search(query="翻譯", use_metadata_ranking=True)
     assert [spec.name for spec in results][:2] == ["translate.audio", "translate.text"]
+
+
+def test_registry_list_uses_tag_and_prefix_indices():
+    registry = ToolRegistry()
+    for func, name, tags in (
+        (_translate_text, "translate.text", ["lang", "text"]),
+        (_translate_audio, "translate.audio", ["lang", "audio"]),
+        (_helper_tool, "helper.tool", ["misc", "text"]),
+    ):
+        registry.register(ToolSpec.from_function(func, name=name, description=name, tags=tags))
+
+    assert [spec.name for spec in registry.list(tags=["lang"])] == ["translate.text", "translate.audio"]
+    assert [spec.name for spec in registry.list(tags=["text", "lang"])] == ["translate.text"]
+    assert [spec.name for spec in registry.list(prefix="translate.")] == ["translate.audio", "translate.text"]
+    assert [spec.name for spec in registry.list(tags=["text"], prefix="help")] == ["helper.tool"]
+    assert registry.list(tags=["missing"]) == []
+    assert [spec.name for spec in registry.list(prefix=("translate.", "translate.t", "help"))] == [
+        "helper.tool",
+        "translate.audio",
+        "translate.text",
+    ]
+    searched = ToolSearchTool(registry, FailureLogManager()).search(prefix=["helper.", "translate.a"], now=0.0)
+    assert [spec.name for spec in searched] == ["helper.tool", "translate.audio"]
+
+    registry.unregister("translate.text")
+
+    assert [spec.name for spec in registry.list(tags=["text"])] == ["helper.tool"]
+    assert [spec.name for spec in registry.list(prefix="translate.")] == ["translate.audio"]
+    assert "audio" in registry._by_tag and "lang" in registry._by_tag
+
+
+def test_tool_spec_precomputes_lowercase_search_text():
+    spec = ToolSpec.from_function(
+        _translate_text,
+        name="Translate.Text",
+        description="Translate TEXT",
+        tags=["Lang"],
+    )
+    assert spec._search_text == "translate.text translate text lang"
+
+    registry = ToolRegistry()
+    registry.register(spec)
+    registry.register(
+        ToolSpec.from_function(_helper_tool, name="helper.tool", description="一般輔助任務")
+    )
+
+    results = ToolSearchTool(registry, FailureLogManager()).search(query="LANG", now=0.0)
+    assert results[0] is spec
+
+
+def test_search_top_k_matches_full_ranking():
+    registry = ToolRegistry()
+    failure_log = FailureLogManager()
+    for index in range(12):
+        registry.register(
+            ToolSpec.from_function(
+                _helper_tool,
+                name=f"helper.tool{index:02d}",
+                description="一般輔助任務",
+                tags=["misc"],
+            )
+        )
+        if index % 3 == 0:
+            failure_log.record_failure(f"helper.tool{index:02d}", timestamp=10.0)
+
+    searcher = ToolSearchTool(registry, failure_log)
+    full = searcher.search(query="helper", top_k=12, now=10.0)
+
+    assert searcher.search(query="helper", top_k=4, now=10.0) == full[:4]
+    assert searcher.search(query="helper", top_k=0, now=10.0) == []
+    assert [spec.name for spec in full[-4:]] == [f"helper.tool{i:02d}" for i in (0, 3, 6, 9)]
+
+
+def test_tool_spec_normalizes_metadata_once():
+    spec = ToolSpec.from_function(
+        _helper_tool,
+        name="helper.tool",
+        description="一般輔助任務",
+        tags=["misc"],
+        metadata={"cost": "1.5", "category": "analysis"},
+    )
+
+    assert spec.tool_metadata is spec.normalized_metadata()
+    assert spec.tool_metadata.cost == 1.5
+    assert spec.tool_metadata.category == "analysis"
+    assert spec.tool_metadata.tags == ("misc",)
+
+
+def test_rule_based_tag_filter_uses_precomputed_tag_sets():
+    from toolanything.core.selection_strategies import RuleBasedStrategy
+
+    text = ToolSpec.from_function(_translate_text, name="translate.text", description="t", tags=["lang", "text"])
+    audio = ToolSpec.from_function(_translate_audio, name="translate.audio", description="a", tags=["lang"])
+
+    assert text._tag_set == frozenset({"lang", "text"})
+    assert RuleBasedStrategy()._filter_by_tags([text, audio], ["text", "lang"]) == [text]
+    assert RuleBasedStrategy()._filter_by_tags([text, audio], ["lang"]) == [text, audio]
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import json
 import time
-from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# 重複探測同一個 server 時沿用 keep-alive 連線，不必每次重新握手。
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 
 def check_server(url: str = "http://localhost:9090/tools") -> bool:
@@ -20,12 +25,13 @@ def check_server(url: str = "http://localhost:9090/tools") -> bool:
     """
 
     try:
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=5)
         if response.status_code == 200:
             print("Server is running!")
             print("Tools available:")
-            parsed: Any = response.json()
-            print(json.dumps(parsed, indent=2, ensure_ascii=False))
+            raw = response.text
+            json.loads(raw)  # 僅驗證格式，直接輸出原始內容，不再重新序列化。
+            print(raw)
             return True
 
         print(f"Server returned status code: {response.status_code}")
@@ -35,7 +41,33 @@ def check_server(url: str = "http://localhost:9090/tools") -> bool:
         return False
 
 
+def wait_for_server(url: str = "http://localhost:9090/tools", *, timeout: float = 5.0) -> bool:
+    """輪詢直到 server 回應 200 或逾時；先立即嘗試，之後以指數退避重試。
+
+    Args:
+        url: MCP Tool Server 的工具列舉端點。
+        timeout: 最長等待秒數。
+
+    Returns:
+        在逾時前收到 200 回應則為 ``True``，否則為 ``False``。
+    """
+
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            if _SESSION.get(url, timeout=1).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.5)
+
+
 if __name__ == "__main__":
-    # Wait a bit for server to start
-    time.sleep(2)
+    # 等 server 就緒即可檢查，不再固定睡 2 秒
+    wait_for_server()
     check_server()